@@ -54,19 +54,20 @@ async def run_scraper(scraper_class, school_data):
     """Run a scraper on the given school data"""
     try:
         scraper = scraper_class()
-        return await scraper.scrape(school_data)
+        # Scrapers take the school as a dict
+        return await scraper.scrape(school_data.as_dict())
     except Exception as e:
-        st.error(f"Error scraping {school_data['name']}: {str(e)}")
+        st.error(f"Error scraping {school_data.name}: {str(e)}")
         traceback.print_exc()
         return None
 
 # Function to run multiple scrapers in parallel
-async def run_scrapers(selected_schools, school_data_list, scrapers):
+async def run_scrapers(selected_schools, scrapers):
     """Run scrapers for multiple schools in parallel"""
     tasks = []
     for school in selected_schools:
         # Find the matching school data
-        school_data = next((s for s in school_data_list if s["name"] == school), None)
+        school_data = SchoolData.get_by_name(school)
         if not school_data:
             continue
             
@@ -270,7 +271,7 @@ def display_school_data(school_info: Dict[str, Any]):
 def main():
     # Load school data and scrapers
     school_data_list = SchoolData.get_schools_list()
-    school_names = [school["name"] for school in school_data_list]
+    school_names = [school.name for school in school_data_list]
     scrapers = load_scrapers()
     
     # School selection
@@ -332,7 +333,7 @@ def main():
                     # Run the scrapers
                     status_text.text("Scraping schools... This may take a minute.")
                     # Pass scrape options to run_scrapers function
-                    results = loop.run_until_complete(run_scrapers(selected_schools, school_data_list, scrapers))
+                    results = loop.run_until_complete(run_scrapers(selected_schools, scrapers))
                     
                     # Progress updates (assuming each school takes roughly equal time)
                     total_schools = len(selected_schools)
@@ -4,6 +4,9 @@ from playwright.async_api import async_playwright
 
 logger = logging.getLogger(__name__)
 
+# Maximum number of pages open at once in the shared browser context
+MAX_CONCURRENT_PAGES = 5
+
 class PlaywrightManager:
     """A utility for handling browser-based scraping with Playwright.
     
@@ -16,19 +19,42 @@ class PlaywrightManager:
         self.browser = None
         self.context = None
         self._is_initialized = False
+        self._loop = None
+        self._init_lock = None
+        self._page_slots = None
+        # Number of running scrapers that have registered to use the browser
+        self._users = 0
+    
+    def _bind_to_running_loop(self):
+        """Create the lock and page semaphore for the current event loop.
+        
+        asyncio primitives belong to the loop they are first used on, and the
+        app starts a new loop for every scraping run.
+        """
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            self._loop = loop
+            self._init_lock = asyncio.Lock()
+            self._page_slots = asyncio.Semaphore(MAX_CONCURRENT_PAGES)
     
     async def initialize(self):
         """Initialize the Playwright browser if not already initialized."""
-        if not self._is_initialized:
-            try:
-                self.playwright = await async_playwright().start()
-                self.browser = await self.playwright.webkit.launch(headless=False)
-                self.context = await self.browser.new_context()
-                self._is_initialized = True
-                logger.info("Playwright browser initialized")
-            except Exception as e:
-                logger.error(f"Failed to initialize Playwright browser: {e}")
-                raise
+        self._bind_to_running_loop()
+        if self._is_initialized:
+            return
+        
+        # Concurrent scrapes share one browser, so only the first caller launches it
+        async with self._init_lock:
+            if not self._is_initialized:
+                try:
+                    self.playwright = await async_playwright().start()
+                    self.browser = await self.playwright.webkit.launch(headless=False)
+                    self.context = await self.browser.new_context()
+                    self._is_initialized = True
+                    logger.info("Playwright browser initialized")
+                except Exception as e:
+                    logger.error(f"Failed to initialize Playwright browser: {e}")
+                    raise
     
     async def get_page_content(self, url, wait_for_selector=None, wait_time=5000):
         """
@@ -45,35 +71,50 @@ class PlaywrightManager:
         await self.initialize()
         
         try:
-            page = await self.context.new_page()
-            
-            # Navigate to the URL
-            await page.goto(url, wait_until="networkidle")
-            
-            # Wait for a specific selector if provided (used for pages with dynamic content)
-            if wait_for_selector:
+            # Open pages in the shared context, a bounded number at a time
+            async with self._page_slots:
+                page = await self.context.new_page()
+                
                 try:
-                    await page.wait_for_selector(wait_for_selector, timeout=wait_time)
-                except Exception as e:
-                    logger.warning(f"Selector '{wait_for_selector}' not found on page: {e}")
-            else:
-                # Otherwise just wait a moment for any animations/transitions
-                await page.wait_for_timeout(1000)
-            
-            # Get the page content after waiting
-            content = await page.content()
-            
-            # Close the page to free resources
-            await page.close()
-            
-            return content
+                    # Navigate to the URL
+                    await page.goto(url, wait_until="networkidle")
+                    
+                    # Wait for a specific selector if provided (used for pages with dynamic content)
+                    if wait_for_selector:
+                        try:
+                            await page.wait_for_selector(wait_for_selector, timeout=wait_time)
+                        except Exception as e:
+                            logger.warning(f"Selector '{wait_for_selector}' not found on page: {e}")
+                    else:
+                        # Otherwise just wait a moment for any animations/transitions
+                        await page.wait_for_timeout(1000)
+                    
+                    # Get the page content after waiting
+                    return await page.content()
+                finally:
+                    # Close the page to free resources
+                    await page.close()
         
         except Exception as e:
             logger.error(f"Error fetching page with Playwright: {url}, error: {e}")
             raise
     
+    def acquire(self):
+        """Register a scraper as a user of the shared browser.
+        
+        Scrapers run concurrently against one browser, so each call must be
+        paired with a call to close(); the browser is only shut down once the
+        last registered user has closed it.
+        """
+        self._users += 1
+    
     async def close(self):
-        """Close the browser and clean up resources."""
+        """Release one user of the browser and clean up once none remain."""
+        if self._users > 0:
+            self._users -= 1
+            if self._users:
+                return
+        
         if self._is_initialized:
             try:
                 await self.context.close()
@@ -102,6 +143,10 @@ async def get_with_playwright(url, wait_for_selector=None, wait_time=5000):
     """
     return await playwright_manager.get_page_content(url, wait_for_selector, wait_time)
 
+def open_playwright():
+    """Register the caller as a user of the shared Playwright browser."""
+    playwright_manager.acquire()
+
 async def close_playwright():
-    """Close the Playwright browser instance."""
+    """Release the Playwright browser, closing it when no scraper still uses it."""
     await playwright_manager.close()
\ No newline at end of file
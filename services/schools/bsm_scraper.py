@@ -11,8 +11,8 @@ if __name__ == "__main__":
     sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
 
 from services.scraper import BaseScraper
-from services.session_manager import SessionManager
-from services.playwright_manager import get_with_playwright, close_playwright
+from services.session_manager import get_session_manager
+from services.playwright_manager import get_with_playwright, open_playwright, close_playwright
 
 logger = logging.getLogger(__name__)
 
@@ -24,7 +24,7 @@ class BSMScraper(BaseScraper):
         self.base_url = "https://www.britishschoolmanila.org"
         self.name = "British School Manila"
         self.short_name = "BSM"
-        self.session_manager = SessionManager()
+        self.session_manager = get_session_manager()
     
     async def scrape_tuition_fees(self):
         """Scrape tuition fee information from BSM website"""
@@ -305,12 +305,16 @@ class BSMScraper(BaseScraper):
         """Main method to scrape all data from BSM website"""
         logger.info(f"Starting scraping process for {self.name}")
         
+        # Other scrapers may share the browser, so register before using it
+        open_playwright()
         try:
-            tuition_result = await self.scrape_tuition_fees()
-            curriculum_result = await self.scrape_curriculum()
-            enrollment_result = await self.scrape_enrollment_process()
-            scholarship_result = await self.scrape_scholarships()
-            contact_result = await self.scrape_contact_info()
+            # Hold the shared HTTP session open while the scrape_* methods run
+            async with self.session_manager:
+                tuition_result = await self.scrape_tuition_fees()
+                curriculum_result = await self.scrape_curriculum()
+                enrollment_result = await self.scrape_enrollment_process()
+                scholarship_result = await self.scrape_scholarships()
+                contact_result = await self.scrape_contact_info()
             
             results = {
                 "name": self.name,
@@ -321,15 +325,13 @@ class BSMScraper(BaseScraper):
                 "contact_info": contact_result
             }
             
-            # Close the Playwright browser when done
-            await close_playwright()
-            
             return results
         except Exception as e:
             logger.error(f"Error in main scrape method: {str(e)}")
-            # Make sure to close Playwright even on errors
-            await close_playwright()
             raise
+        finally:
+            # Release the browser whether or not scraping succeeded
+            await close_playwright()
 
 
 if __name__ == "__main__":
@@ -1,6 +1,9 @@
 import sys
 import os
+import copy
+from collections import OrderedDict
 from bs4 import BeautifulSoup
+import soupsieve as sv
 import re
 import json
 import logging
@@ -11,20 +14,96 @@ if __name__ == "__main__":
     sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
 
 from services.scraper import BaseScraper
-from services.session_manager import SessionManager
-from services.playwright_manager import get_with_playwright, close_playwright
+from services.session_manager import get_session_manager
 
 logger = logging.getLogger(__name__)
 
+# Contact page patterns, compiled once at import
+_MAILTO_RE = re.compile(r'mailto:([\w.-]+@[\w.-]+\.\w+)')
+_SUPERINTENDENT_LINE_RE = re.compile(r'Superintendent:?\s*([^<\n]+)')
+_TELEPHONE_LINE_RE = re.compile(r'Telephone:?\s*([^<\n]+)')
+_TELEPHONE_NUMBER_RE = re.compile(r'(?:School\s+)?Telephone:?\s*([\(\)\d\s\.-]+)')
+_SUPERINTENDENT_P_SEL = sv.compile('p:-soup-contains("Superintendent")')
+_TELEPHONE_P_SEL = sv.compile('p:-soup-contains("Telephone")')
+# Elements whose own text (not a descendant's) holds the label
+_SUPERINTENDENT_OWN_SEL = sv.compile(':-soup-contains-own("Superintendent")')
+_TELEPHONE_OWN_SEL = sv.compile(':-soup-contains-own("Telephone")')
+
+_WS_RE = re.compile(r'\s+')
+_LIST_ITEM_SEL = sv.compile('ol li, ul li')
+
+# Scholarship examination keyword patterns, matched against lowercased item text
+_MONTH_RE = re.compile(r'january|february|march|april|may|june|july|august|september|october|november|december')
+_DAY_RE = re.compile(r'monday|tuesday|wednesday|thursday|friday|saturday|sunday')
+_ASSESSMENT_RE = re.compile(r'assessment|exam|test')
+_INTERVIEW_CRITERIA_RE = re.compile(r'personality|interest|attitude|english|financial')
+_SUMMARY_CRITERIA_RE = re.compile(r'spoken|personality|interests|attitude|financial')
+_AM_PM_RE = re.compile(r'AM|PM', re.IGNORECASE)
+
+# Heading text patterns used as BeautifulSoup string= filters
+_FORMS_HEADING_RE = re.compile(r'Forms')
+_REQUIREMENTS_HEADING_RE = re.compile(r'Requirements')
+_EXAM_HEADING_RE = re.compile(r'examination', re.IGNORECASE)
+_DATE_PLACE_HEADING_RE = re.compile(r'date.*place|place.*date', re.IGNORECASE | re.DOTALL)
+_INTERVIEW_HEADING_RE = re.compile(r'interview|appraised', re.IGNORECASE)
+
+# Maximum number of parsed page results kept for reuse on a 304
+_MAX_PARSED_RESULTS = 16
+
+
+def _norm(text):
+    """Collapse runs of whitespace into single spaces and strip the ends"""
+    return _WS_RE.sub(' ', text).strip() if text else text
+
+
+def _extract_list_items(node):
+    """Return the normalized text of every ordered/unordered list item under node"""
+    return [_norm(li.get_text(strip=True)) for li in _LIST_ITEM_SEL.select(node)]
+
+
+def _all_found(contact_data):
+    """Check whether every contact field has been extracted"""
+    return all(contact_data.values())
+
+
 class ISMScraper(BaseScraper):
     """Scraper for International School Manila website"""
     
+    # Parsed results of pages served with cache validators, least recently
+    # used first: url -> (validators, result)
+    _parsed_results = OrderedDict()
+    
     def __init__(self):
         super().__init__()
         self.base_url = "https://www.ismanila.org"
         self.name = "International School Manila"
         self.short_name = "ISM"
-        self.session_manager = SessionManager()
+        self.session_manager = get_session_manager()
+        self._soup_tasks = {}
+    
+    async def __aenter__(self):
+        await self.session_manager.__aenter__()
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.session_manager.__aexit__(exc_type, exc, tb)
+    
+    async def _fetch_soup(self, url):
+        response = await self.session_manager.get(url)
+        # Parse off the event loop so concurrent scrapes keep making progress
+        return await asyncio.to_thread(BeautifulSoup, response.content, 'lxml')
+    
+    async def _get_soup(self, url):
+        """Return the parsed page at url, fetching and parsing it on first use.
+        
+        The school fees page is read by both the tuition and curriculum
+        scrapes. The pending task is cached rather than the soup, so methods
+        running concurrently all wait on the same fetch and parse.
+        """
+        task = self._soup_tasks.get(url)
+        if task is None:
+            task = self._soup_tasks[url] = asyncio.create_task(self._fetch_soup(url))
+        return await task
     
     async def scrape_tuition_fees(self):
         """Scrape tuition fee information from ISM website"""
@@ -33,412 +112,418 @@ class ISMScraper(BaseScraper):
         try:
             url = f"{self.base_url}/admissions/school-fees"
             
-            # Use session manager
-            response = await self.session_manager.get(url)
-            
-            # Parse the HTML content
-            soup = BeautifulSoup(response.text, 'html.parser')
-            
-            # Find the table with tuition fee information
-            table = soup.select_one("table.table")
+            # Share the parsed page with scrape_curriculum
+            soup = await self._get_soup(url)
             
-            if not table:
-                logger.warning(f"Tuition fee table not found on {url}")
-                return {"status": "error", "message": "Tuition fee table not found"}
+            # Extract off the event loop so concurrent scrapes keep making progress
+            return await asyncio.to_thread(self._parse_tuition_fees, soup)
             
-            # Initialize data structure
-            tuition_data = {
-                "regular_program": {},
-                "specialized_program": {},
-                "additional_fees": {},
-                "other_fees": {}
+        except Exception as e:
+            logger.error(f"Error scraping tuition fees for {self.name}: {str(e)}")
+            return {
+                "status": "error",
+                "message": str(e)
             }
+    
+    def _parse_tuition_fees(self, soup):
+        """Parse tuition fee tables and fee lists from the school fees page"""
+        # Find the table with tuition fee information
+        table = soup.select_one("table.table")
+        
+        if not table:
+            logger.warning("Tuition fee table not found on the school fees page")
+            return {"status": "error", "message": "Tuition fee table not found"}
+        
+        # Initialize data structure
+        tuition_data = {
+            "regular_program": {},
+            "specialized_program": {},
+            "additional_fees": {},
+            "other_fees": {}
+        }
+        
+        # Add diagnostic logging
+        logger.info(f"Table found with {len(table.find_all('tr'))} rows")
+        
+        # Extract regular program tuition fees
+        current_section = None
+        rows = table.find_all('tr')
+        
+        for row_idx, row in enumerate(rows):
+            cells = row.find_all(['td', 'th'])
+            if len(cells) < 2:
+                continue
+        
+            # Get the program/grade content from the first column
+            program_cell = cells[0]
+            program_content = program_cell.get_text(strip=True)
+        
+            # Skip empty rows
+            if not program_content:
+                continue
+        
+            # Log cell contents for debugging
+            logger.info(f"Row {row_idx} - First cell content: '{program_content}'")
+        
+            # Check if this is a section header
+            if "REGULAR PROGRAM" in program_content.upper():
+                current_section = "regular_program"
+                logger.info(f"Found REGULAR PROGRAM section at row {row_idx}")
+                continue
+            elif "SPECIALIZED" in program_content.upper() and "PROGRAM" in program_content.upper():
+                current_section = "specialized_program"
+                logger.info(f"Found SPECIALIZED PROGRAM section at row {row_idx}")
+                continue
+        
+            # Skip rows that don't contain actual program data (might be spacing rows)
+            if len(cells) < 4 or not current_section:
+                continue
+        
+            # Extract fee information from other columns
+            annual_fee = cells[1].get_text(strip=True) if len(cells) > 1 else ""
+            semester1_fee = cells[2].get_text(strip=True) if len(cells) > 2 else ""
+            semester2_fee = cells[3].get_text(strip=True) if len(cells) > 3 else ""
+        
+            # Skip rows without fee information
+            if not annual_fee:
+                continue
+        
+            # Log extracted data
+            logger.info(f"  - Program: '{program_content}', Annual: '{annual_fee}', Sem1: '{semester1_fee}', Sem2: '{semester2_fee}'")
+        
+            # Clean and format the program name
+            program_name = re.sub(r'<[^>]+>', '', program_content)
+            program_name = program_name.strip()
+        
+            if current_section == "regular_program":
+                tuition_data["regular_program"][program_name] = {
+                    "annual": annual_fee,
+                    "semester1": semester1_fee,
+                    "semester2": semester2_fee
+                }
+                logger.info(f"Added to regular_program: {program_name}")
+            elif current_section == "specialized_program":
+                tuition_data["specialized_program"][program_name] = {
+                    "annual": annual_fee,
+                    "semester1": semester1_fee,
+                    "semester2": semester2_fee
+                }
+                logger.info(f"Added to specialized_program: {program_name}")
+        
+        # Add a summary log
+        logger.info(f"Extracted {len(tuition_data['regular_program'])} regular programs and {len(tuition_data['specialized_program'])} specialized programs")
+        
+        # Extract additional fees and other fees
+        content_section = soup.select_one("section.rich-text-block div.content")
+        
+        if content_section:
+            # Get main fees (first ul)
+            main_fees_list = content_section.select("ul")[0].find_all("li", recursive=False) if content_section.select("ul") else []
+            for fee_item in main_fees_list:
+                fee_text = fee_item.get_text(strip=True)
+                fee_match = re.search(r'(.+?)\s*-\s*(.+)', fee_text)
+                if fee_match:
+                    fee_name = fee_match.group(1).strip()
+                    fee_value = fee_match.group(2).strip()
+                    tuition_data["additional_fees"][fee_name] = fee_value
+        
+            # Find additional program tuition fees
+            headings = content_section.find_all(['h1', 'h2', 'h3', 'h4'])
+            additional_program_heading = None
+            other_fees_heading = None
+        
+            for heading in headings:
+                if "Additional Program" in heading.get_text():
+                    additional_program_heading = heading
+                elif "Other Fees" in heading.get_text():
+                    other_fees_heading = heading
+        
+            # Get other fees section
+            if other_fees_heading:
+                other_fees_ul = other_fees_heading.find_next('ul')
+                if other_fees_ul:
+                    for li in other_fees_ul.find_all('li', recursive=False):
+                        fee_text = li.get_text(strip=True)
+        
+                        # Handle special case of car stickers which has nested list
+                        if "Car Stickers" in fee_text:
+                            main_fee_match = re.search(r'(.+?)\s*\(', fee_text)
+                            if main_fee_match:
+                                fee_name = main_fee_match.group(1).strip()
+                                # Extract sub-items
+                                sub_ul = li.find('ul')
+                                if sub_ul:
+                                    for sub_li in sub_ul.find_all('li'):
+                                        sub_text = sub_li.get_text(strip=True)
+                                        sub_match = re.search(r'(.+?)\s*-\s*(.+)', sub_text)
+                                        if sub_match:
+                                            sub_name = sub_match.group(1).strip()
+                                            sub_value = sub_match.group(2).strip()
+                                            tuition_data["other_fees"][sub_name] = sub_value
+                        else:
+                            # Regular fee item
+                            fee_match = re.search(r'(.+?)\s*-\s*(.+)', fee_text)
+                            if fee_match:
+                                fee_name = fee_match.group(1).strip()
+                                fee_value = fee_match.group(2).strip()
+                                tuition_data["other_fees"][fee_name] = fee_value
+        
+        # Add a direct parsing of the sample data
+        # This is a fallback to handle the specific HTML structure shown in the user's example
+        if not tuition_data["regular_program"] and not tuition_data["specialized_program"]:
+            logger.info("Attempting alternative parsing method for tuition data")
+        
+            # Try to find a table containing tuition information
+            tables = soup.find_all('table')
+        
+            for table in tables:
+                rows = table.find_all('tr')
+                current_section = None
+        
+                for row in rows:
+                    cells = row.find_all(['td', 'th'])
+                    if len(cells) < 1:
+                        continue
+        
+                    first_cell = cells[0].get_text(strip=True)
+        
+                    # Check for section headers
+                    if "REGULAR PROGRAM" in first_cell.upper() or "REGULAR" in first_cell.upper() and "PROGRAM" in first_cell.upper():
+                        current_section = "regular_program"
+                        logger.info(f"Alternative method: Found REGULAR PROGRAM section")
+                        continue
+                    elif "SPECIALIZED" in first_cell.upper() and "PROGRAM" in first_cell.upper():
+                        current_section = "specialized_program"
+                        logger.info(f"Alternative method: Found SPECIALIZED PROGRAM section")
+                        continue
+        
+                    # Skip if not in a valid section or no valid data
+                    if not current_section or len(cells) < 2:
+                        continue
+        
+                    program_name = first_cell.strip()
+                    # Skip empty program names or section headers
+                    if not program_name or "PROGRAM" in program_name.upper():
+                        continue
+        
+                    # Extract fee information
+                    if len(cells) >= 2:
+                        annual_fee = cells[1].get_text(strip=True)
+                        semester1_fee = cells[2].get_text(strip=True) if len(cells) > 2 else ""
+                        semester2_fee = cells[3].get_text(strip=True) if len(cells) > 3 else ""
+        
+                        if annual_fee:
+                            logger.info(f"Alternative method: Found {program_name} with fee {annual_fee}")
+        
+                            if current_section == "regular_program":
+                                tuition_data["regular_program"][program_name] = {
+                                    "annual": annual_fee,
+                                    "semester1": semester1_fee,
+                                    "semester2": semester2_fee
+                                }
+                            elif current_section == "specialized_program":
+                                tuition_data["specialized_program"][program_name] = {
+                                    "annual": annual_fee,
+                                    "semester1": semester1_fee,
+                                    "semester2": semester2_fee
+                                }
+        
+        return {
+            "status": "success",
+            "data": tuition_data
+        }
+    
+    async def scrape_curriculum(self):
+        """Scrape curriculum information from ISM website"""
+        logger.info(f"Scraping curriculum for {self.name}")
+        
+        try:
+            # Use the school fees page which has curriculum information
+            url = f"{self.base_url}/admissions/school-fees"
             
-            # Add diagnostic logging
-            logger.info(f"Table found with {len(table.find_all('tr'))} rows")
+            # Share the parsed page with scrape_tuition_fees
+            soup = await self._get_soup(url)
+
+            # Extract off the event loop so concurrent scrapes keep making progress
+            return await asyncio.to_thread(self._parse_curriculum, soup)
             
-            # Extract regular program tuition fees
+        except Exception as e:
+            logger.error(f"Error scraping curriculum for {self.name}: {str(e)}")
+            return {
+                "status": "error",
+                "message": str(e)
+            }
+    
+    def _parse_curriculum(self, soup):
+        """Parse program information from the school fees page"""
+        # Initialize curriculum data structure with organized categories
+        curriculum_data = {
+            "regular_program": {},
+            "specialized_program": {},
+            "additional_programs": {}
+        }
+        
+        # Find the table with tuition fee information which contains program data
+        table = soup.select_one("table.table")
+        
+        if table:
+            # Extract regular program and specialized program information
             current_section = None
             rows = table.find_all('tr')
-            
-            for row_idx, row in enumerate(rows):
+        
+            for row in rows:
                 cells = row.find_all(['td', 'th'])
-                if len(cells) < 2:
+                if len(cells) < 1:
                     continue
-                    
+        
                 # Get the program/grade content from the first column
-                program_cell = cells[0]
-                program_content = program_cell.get_text(strip=True)
-                
+                first_cell = cells[0].get_text(strip=True)
+        
                 # Skip empty rows
-                if not program_content:
+                if not first_cell:
                     continue
-                
-                # Log cell contents for debugging
-                logger.info(f"Row {row_idx} - First cell content: '{program_content}'")
-                
+        
                 # Check if this is a section header
-                if "REGULAR PROGRAM" in program_content.upper():
+                if "REGULAR PROGRAM" in first_cell.upper() or "REGULAR" in first_cell.upper() and "PROGRAM" in first_cell.upper():
                     current_section = "regular_program"
-                    logger.info(f"Found REGULAR PROGRAM section at row {row_idx}")
+                    logger.info(f"Curriculum: Found REGULAR PROGRAM section")
                     continue
-                elif "SPECIALIZED" in program_content.upper() and "PROGRAM" in program_content.upper():
+                elif "SPECIALIZED" in first_cell.upper() and "PROGRAM" in first_cell.upper():
                     current_section = "specialized_program"
-                    logger.info(f"Found SPECIALIZED PROGRAM section at row {row_idx}")
+                    logger.info(f"Curriculum: Found SPECIALIZED PROGRAM section")
                     continue
-                
-                # Skip rows that don't contain actual program data (might be spacing rows)
-                if len(cells) < 4 or not current_section:
+        
+                # Skip if not in a valid section or no valid data
+                if not current_section:
                     continue
-                
-                # Extract fee information from other columns
-                annual_fee = cells[1].get_text(strip=True) if len(cells) > 1 else ""
-                semester1_fee = cells[2].get_text(strip=True) if len(cells) > 2 else ""
-                semester2_fee = cells[3].get_text(strip=True) if len(cells) > 3 else ""
-                
-                # Skip rows without fee information
-                if not annual_fee:
+        
+                program_name = first_cell.strip()
+                # Skip empty program names or section headers
+                if not program_name or "PROGRAM" in program_name.upper():
                     continue
-                
-                # Log extracted data
-                logger.info(f"  - Program: '{program_content}', Annual: '{annual_fee}', Sem1: '{semester1_fee}', Sem2: '{semester2_fee}'")
-                
-                # Clean and format the program name
-                program_name = re.sub(r'<[^>]+>', '', program_content)
-                program_name = program_name.strip()
-                
+        
+                # Add program to curriculum data with type and description separated
                 if current_section == "regular_program":
-                    tuition_data["regular_program"][program_name] = {
-                        "annual": annual_fee,
-                        "semester1": semester1_fee,
-                        "semester2": semester2_fee
+                    curriculum_data["regular_program"][program_name] = {
+                        "type": "Regular Program",
+                        "description": program_name
                     }
-                    logger.info(f"Added to regular_program: {program_name}")
+                    logger.info(f"Curriculum: Added to regular_program: {program_name}")
                 elif current_section == "specialized_program":
-                    tuition_data["specialized_program"][program_name] = {
-                        "annual": annual_fee,
-                        "semester1": semester1_fee,
-                        "semester2": semester2_fee
+                    curriculum_data["specialized_program"][program_name] = {
+                        "type": "Specialized Learning Support Program",
+                        "description": program_name
                     }
-                    logger.info(f"Added to specialized_program: {program_name}")
-            
-            # Add a summary log
-            logger.info(f"Extracted {len(tuition_data['regular_program'])} regular programs and {len(tuition_data['specialized_program'])} specialized programs")
-            
-            # Extract additional fees and other fees
-            content_section = soup.select_one("section.rich-text-block div.content")
-            
-            if content_section:
-                # Get main fees (first ul)
-                main_fees_list = content_section.select("ul")[0].find_all("li", recursive=False) if content_section.select("ul") else []
-                for fee_item in main_fees_list:
-                    fee_text = fee_item.get_text(strip=True)
-                    fee_match = re.search(r'(.+?)\s*-\s*(.+)', fee_text)
-                    if fee_match:
-                        fee_name = fee_match.group(1).strip()
-                        fee_value = fee_match.group(2).strip()
-                        tuition_data["additional_fees"][fee_name] = fee_value
-                
-                # Find additional program tuition fees
-                headings = content_section.find_all(['h1', 'h2', 'h3', 'h4'])
-                additional_program_heading = None
-                other_fees_heading = None
-                
-                for heading in headings:
-                    if "Additional Program" in heading.get_text():
-                        additional_program_heading = heading
-                    elif "Other Fees" in heading.get_text():
-                        other_fees_heading = heading
-                
-                # Get other fees section
-                if other_fees_heading:
-                    other_fees_ul = other_fees_heading.find_next('ul')
-                    if other_fees_ul:
-                        for li in other_fees_ul.find_all('li', recursive=False):
-                            fee_text = li.get_text(strip=True)
-                            
-                            # Handle special case of car stickers which has nested list
-                            if "Car Stickers" in fee_text:
-                                main_fee_match = re.search(r'(.+?)\s*\(', fee_text)
-                                if main_fee_match:
-                                    fee_name = main_fee_match.group(1).strip()
-                                    # Extract sub-items
-                                    sub_ul = li.find('ul')
-                                    if sub_ul:
-                                        for sub_li in sub_ul.find_all('li'):
-                                            sub_text = sub_li.get_text(strip=True)
-                                            sub_match = re.search(r'(.+?)\s*-\s*(.+)', sub_text)
-                                            if sub_match:
-                                                sub_name = sub_match.group(1).strip()
-                                                sub_value = sub_match.group(2).strip()
-                                                tuition_data["other_fees"][sub_name] = sub_value
-                            else:
-                                # Regular fee item
-                                fee_match = re.search(r'(.+?)\s*-\s*(.+)', fee_text)
-                                if fee_match:
-                                    fee_name = fee_match.group(1).strip()
-                                    fee_value = fee_match.group(2).strip()
-                                    tuition_data["other_fees"][fee_name] = fee_value
-            
-            # Add a direct parsing of the sample data
-            # This is a fallback to handle the specific HTML structure shown in the user's example
-            if not tuition_data["regular_program"] and not tuition_data["specialized_program"]:
-                logger.info("Attempting alternative parsing method for tuition data")
-                
-                # Try to find a table containing tuition information
-                tables = soup.find_all('table')
-                
-                for table in tables:
-                    rows = table.find_all('tr')
-                    current_section = None
-                    
-                    for row in rows:
-                        cells = row.find_all(['td', 'th'])
-                        if len(cells) < 1:
-                            continue
-                        
-                        first_cell = cells[0].get_text(strip=True)
-                        
-                        # Check for section headers
-                        if "REGULAR PROGRAM" in first_cell.upper() or "REGULAR" in first_cell.upper() and "PROGRAM" in first_cell.upper():
-                            current_section = "regular_program"
-                            logger.info(f"Alternative method: Found REGULAR PROGRAM section")
-                            continue
-                        elif "SPECIALIZED" in first_cell.upper() and "PROGRAM" in first_cell.upper():
-                            current_section = "specialized_program"
-                            logger.info(f"Alternative method: Found SPECIALIZED PROGRAM section")
-                            continue
-                        
-                        # Skip if not in a valid section or no valid data
-                        if not current_section or len(cells) < 2:
-                            continue
-                        
-                        program_name = first_cell.strip()
-                        # Skip empty program names or section headers
-                        if not program_name or "PROGRAM" in program_name.upper():
-                            continue
-                            
-                        # Extract fee information
-                        if len(cells) >= 2:
-                            annual_fee = cells[1].get_text(strip=True)
-                            semester1_fee = cells[2].get_text(strip=True) if len(cells) > 2 else ""
-                            semester2_fee = cells[3].get_text(strip=True) if len(cells) > 3 else ""
-                            
-                            if annual_fee:
-                                logger.info(f"Alternative method: Found {program_name} with fee {annual_fee}")
-                                
-                                if current_section == "regular_program":
-                                    tuition_data["regular_program"][program_name] = {
-                                        "annual": annual_fee,
-                                        "semester1": semester1_fee,
-                                        "semester2": semester2_fee
-                                    }
-                                elif current_section == "specialized_program":
-                                    tuition_data["specialized_program"][program_name] = {
-                                        "annual": annual_fee,
-                                        "semester1": semester1_fee,
-                                        "semester2": semester2_fee
-                                    }
-            
-            return {
-                "status": "success",
-                "data": tuition_data
-            }
-            
-        except Exception as e:
-            logger.error(f"Error scraping tuition fees for {self.name}: {str(e)}")
-            return {
-                "status": "error",
-                "message": str(e)
-            }
-    
-    async def scrape_curriculum(self):
-        """Scrape curriculum information from ISM website"""
-        logger.info(f"Scraping curriculum for {self.name}")
+                    logger.info(f"Curriculum: Added to specialized_program: {program_name}")
         
-        try:
-            # Use the school fees page which has curriculum information
-            url = f"{self.base_url}/admissions/school-fees"
-            
-            # Use session manager
-            response = await self.session_manager.get(url)
-
-            soup = BeautifulSoup(response.text, 'html.parser')            
-            # Initialize curriculum data structure with organized categories
-            curriculum_data = {
-                "regular_program": {},
-                "specialized_program": {},
-                "additional_programs": {}
-            }
-            
-            # Find the table with tuition fee information which contains program data
-            table = soup.select_one("table.table")
-            
-            if table:
-                # Extract regular program and specialized program information
-                current_section = None
+        # If no programs were found in the table, try the alternative parsing method
+        if not curriculum_data["regular_program"] and not curriculum_data["specialized_program"]:
+            logger.info("Attempting alternative parsing method for curriculum data")
+        
+            # Try to find a table containing curriculum information
+            tables = soup.find_all('table')
+        
+            for table in tables:
                 rows = table.find_all('tr')
-                
+                current_section = None
+        
                 for row in rows:
                     cells = row.find_all(['td', 'th'])
                     if len(cells) < 1:
                         continue
-                        
-                    # Get the program/grade content from the first column
+        
                     first_cell = cells[0].get_text(strip=True)
-                    
-                    # Skip empty rows
-                    if not first_cell:
-                        continue
-                    
-                    # Check if this is a section header
+        
+                    # Check for section headers
                     if "REGULAR PROGRAM" in first_cell.upper() or "REGULAR" in first_cell.upper() and "PROGRAM" in first_cell.upper():
                         current_section = "regular_program"
-                        logger.info(f"Curriculum: Found REGULAR PROGRAM section")
+                        logger.info(f"Alternative method: Found REGULAR PROGRAM section for curriculum")
                         continue
                     elif "SPECIALIZED" in first_cell.upper() and "PROGRAM" in first_cell.upper():
                         current_section = "specialized_program"
-                        logger.info(f"Curriculum: Found SPECIALIZED PROGRAM section")
+                        logger.info(f"Alternative method: Found SPECIALIZED PROGRAM section for curriculum")
                         continue
-                    
+        
                     # Skip if not in a valid section or no valid data
                     if not current_section:
                         continue
-                    
+        
                     program_name = first_cell.strip()
                     # Skip empty program names or section headers
                     if not program_name or "PROGRAM" in program_name.upper():
                         continue
-                    
+        
                     # Add program to curriculum data with type and description separated
                     if current_section == "regular_program":
                         curriculum_data["regular_program"][program_name] = {
                             "type": "Regular Program",
                             "description": program_name
                         }
-                        logger.info(f"Curriculum: Added to regular_program: {program_name}")
+                        logger.info(f"Alternative method: Added to regular_program curriculum: {program_name}")
                     elif current_section == "specialized_program":
                         curriculum_data["specialized_program"][program_name] = {
                             "type": "Specialized Learning Support Program",
                             "description": program_name
                         }
-                        logger.info(f"Curriculum: Added to specialized_program: {program_name}")
-            
-            # If no programs were found in the table, try the alternative parsing method
-            if not curriculum_data["regular_program"] and not curriculum_data["specialized_program"]:
-                logger.info("Attempting alternative parsing method for curriculum data")
-                
-                # Try to find a table containing curriculum information
-                tables = soup.find_all('table')
-                
-                for table in tables:
-                    rows = table.find_all('tr')
-                    current_section = None
-                    
-                    for row in rows:
-                        cells = row.find_all(['td', 'th'])
-                        if len(cells) < 1:
-                            continue
-                        
-                        first_cell = cells[0].get_text(strip=True)
-                        
-                        # Check for section headers
-                        if "REGULAR PROGRAM" in first_cell.upper() or "REGULAR" in first_cell.upper() and "PROGRAM" in first_cell.upper():
-                            current_section = "regular_program"
-                            logger.info(f"Alternative method: Found REGULAR PROGRAM section for curriculum")
-                            continue
-                        elif "SPECIALIZED" in first_cell.upper() and "PROGRAM" in first_cell.upper():
-                            current_section = "specialized_program"
-                            logger.info(f"Alternative method: Found SPECIALIZED PROGRAM section for curriculum")
-                            continue
-                        
-                        # Skip if not in a valid section or no valid data
-                        if not current_section:
-                            continue
-                        
-                        program_name = first_cell.strip()
-                        # Skip empty program names or section headers
-                        if not program_name or "PROGRAM" in program_name.upper():
-                            continue
-                        
-                        # Add program to curriculum data with type and description separated
-                        if current_section == "regular_program":
-                            curriculum_data["regular_program"][program_name] = {
-                                "type": "Regular Program",
-                                "description": program_name
-                            }
-                            logger.info(f"Alternative method: Added to regular_program curriculum: {program_name}")
-                        elif current_section == "specialized_program":
-                            curriculum_data["specialized_program"][program_name] = {
-                                "type": "Specialized Learning Support Program",
-                                "description": program_name
+                        logger.info(f"Alternative method: Added to specialized_program curriculum: {program_name}")
+        
+        # Extract additional programs from rich text section
+        content_section = soup.select_one("section.rich-text-block div.content")
+        
+        if content_section:
+            # Find additional program section
+            headings = content_section.find_all(['h1', 'h2', 'h3', 'h4'])
+            additional_program_heading = None
+        
+            for heading in headings:
+                if "Additional Program" in heading.get_text():
+                    additional_program_heading = heading
+                    break
+        
+            if additional_program_heading:
+                additional_program_ul = additional_program_heading.find_next('ul')
+                if additional_program_ul:
+                    for li in additional_program_ul.find_all('li', recursive=False):
+                        program_text = li.get_text(strip=True)
+        
+                        # Extract program name (text within strong tags or before first line break)
+                        strong_tag = li.find('strong')
+                        if strong_tag:
+                            program_name = strong_tag.get_text(strip=True)
+                        else:
+                            program_name = program_text.split('\n')[0].strip()
+                            # Clean up any trailing colons or spaces
+                            program_name = re.sub(r':$', '', program_name).strip()
+        
+                        if program_name:
+                            # Extract just the program description without the fees
+                            description = program_name
+        
+                            curriculum_data["additional_programs"][program_name] = {
+                                "type": "Additional Support Program",
+                                "description": description
                             }
-                            logger.info(f"Alternative method: Added to specialized_program curriculum: {program_name}")
-            
-            # Extract additional programs from rich text section
-            content_section = soup.select_one("section.rich-text-block div.content")
-            
-            if content_section:
-                # Find additional program section
-                headings = content_section.find_all(['h1', 'h2', 'h3', 'h4'])
-                additional_program_heading = None
-                
-                for heading in headings:
-                    if "Additional Program" in heading.get_text():
-                        additional_program_heading = heading
-                        break
-                
-                if additional_program_heading:
-                    additional_program_ul = additional_program_heading.find_next('ul')
-                    if additional_program_ul:
-                        for li in additional_program_ul.find_all('li', recursive=False):
-                            program_text = li.get_text(strip=True)
-                            
-                            # Extract program name (text within strong tags or before first line break)
-                            strong_tag = li.find('strong')
-                            if strong_tag:
-                                program_name = strong_tag.get_text(strip=True)
-                            else:
-                                program_name = program_text.split('\n')[0].strip()
-                                # Clean up any trailing colons or spaces
-                                program_name = re.sub(r':$', '', program_name).strip()
-                            
-                            if program_name:
-                                # Extract just the program description without the fees
-                                description = program_name
-                                
-                                curriculum_data["additional_programs"][program_name] = {
-                                    "type": "Additional Support Program",
-                                    "description": description
-                                }
-                                logger.info(f"Added additional program: {program_name}")
-            
-            # Perform post-processing to ensure consistent formatting across all program types
-            for program_type in curriculum_data:
-                for program_name, program_info in list(curriculum_data[program_type].items()):
-                    # Clean up any duplicate or trailing punctuation
-                    description = program_info.get("description", "")
-                    description = re.sub(r'\s+', ' ', description).strip()
-                    program_info["description"] = description
-            
-            return {
-                "status": "success",
-                "data": curriculum_data
-            }
-            
-        except Exception as e:
-            logger.error(f"Error scraping curriculum for {self.name}: {str(e)}")
-            return {
-                "status": "error",
-                "message": str(e)
-            }
+                            logger.info(f"Added additional program: {program_name}")
+        
+        # Perform post-processing to ensure consistent formatting across all program types
+        for program_type in curriculum_data:
+            for program_name, program_info in list(curriculum_data[program_type].items()):
+                # Clean up any duplicate or trailing punctuation
+                description = program_info.get("description", "")
+                description = _norm(description)
+                program_info["description"] = description
+        
+        return {
+            "status": "success",
+            "data": curriculum_data
+        }
     
-    async def parse_requirements_data(self, html_content):
+    def parse_requirements_data(self, html_content):
         """
         Parse the HTML content to extract structured requirements data by grade level
         """
         logger.info("Parsing detailed requirements data")
-        soup = BeautifulSoup(html_content, 'html.parser')
+        soup = BeautifulSoup(html_content, 'lxml')
         
         # Initialize the structured data
         requirements_data = {}
@@ -483,9 +568,9 @@ class ISMScraper(BaseScraper):
                 continue
             
             # Extract forms
-            forms_section = content_div.find(['p', 'h3', 'h4'], string=lambda s: s and 'Forms' in s)
+            forms_section = content_div.find(['p', 'h3', 'h4'], string=_FORMS_HEADING_RE)
             if not forms_section:
-                forms_section = content_div.find('strong', string=lambda s: s and 'Forms' in s)
+                forms_section = content_div.find('strong', string=_FORMS_HEADING_RE)
                 
             if forms_section:
                 # Get the forms list
@@ -502,9 +587,9 @@ class ISMScraper(BaseScraper):
                             logger.info(f"Added form for {grade_name}: {form_data['name']}")
             
             # Extract requirements
-            requirements_section = content_div.find(['p', 'h3', 'h4'], string=lambda s: s and 'Requirements' in s)
+            requirements_section = content_div.find(['p', 'h3', 'h4'], string=_REQUIREMENTS_HEADING_RE)
             if not requirements_section:
-                requirements_section = content_div.find('strong', string=lambda s: s and 'Requirements' in s)
+                requirements_section = content_div.find('strong', string=_REQUIREMENTS_HEADING_RE)
                 
             if requirements_section:
                 # Get the requirements list
@@ -530,72 +615,8 @@ class ISMScraper(BaseScraper):
             # Use session manager
             response = await self.session_manager.get(url)
             
-            # Parse the HTML content
-            soup = BeautifulSoup(response.text, 'html.parser')
-            
-            enrollment_data = {
-                "overview": "",
-                "steps": [],
-                "requirements": [],
-                "grade_requirements": {}  # Initialize the grade_requirements dictionary
-            }
-            
-            # Extract overview
-            overview_section = soup.select_one("section.lead-text")
-            if overview_section:
-                enrollment_data["overview"] = overview_section.get_text(strip=True)
-            
-            # Extract steps from the admissions process tabs
-            process_tabs = soup.select("div.tabs.style-accordion .tab-title")
-            process_contents = soup.select("div.tabs.style-accordion .accordion-content")
-            
-            if process_tabs and len(process_tabs) == len(process_contents):
-                logger.info(f"Found {len(process_tabs)} process steps tabs")
-                
-                for i, (tab, content) in enumerate(zip(process_tabs, process_contents)):
-                    step_title = tab.get_text(strip=True)
-                    step_content = content.get_text(strip=True)
-                    
-                    step_data = {
-                        "title": step_title,
-                        "description": step_content
-                    }
-                    
-                    # Check if this content has a list
-                    list_items = content.select("ol li, ul li")
-                    if list_items:
-                        step_data["items"] = [item.get_text(strip=True) for item in list_items]
-                    
-                    enrollment_data["steps"].append(step_data)
-                    logger.info(f"Added step: {step_title}")
-            
-            # Parse the detailed requirements data
-            grade_requirements = await self.parse_requirements_data(response.text)
-            
-            if grade_requirements:
-                enrollment_data["grade_requirements"] = grade_requirements
-                
-                # Extract common requirements across all grade levels
-                all_requirements = []
-                for grade_name, grade_data in grade_requirements.items():
-                    all_requirements.extend(grade_data["requirements"])
-                
-                # Count frequency of each requirement
-                from collections import Counter
-                req_counter = Counter(all_requirements)
-                
-                # Requirements that appear in most grade levels are considered common
-                common_threshold = len(grade_requirements) // 2  # At least half of the grade levels
-                common_requirements = [req for req, count in req_counter.items() if count >= common_threshold]
-                
-                enrollment_data["requirements"] = common_requirements
-            else:
-                logger.warning("Failed to parse grade requirements")
-            
-            return {
-                "status": "success",
-                "data": enrollment_data
-            }
+            # Parse off the event loop so concurrent scrapes keep making progress
+            return await asyncio.to_thread(self._parse_enrollment_process, response.content)
             
         except Exception as e:
             logger.error(f"Error scraping enrollment process for {self.name}: {str(e)}")
@@ -604,6 +625,75 @@ class ISMScraper(BaseScraper):
                 "message": str(e)
             }
     
+    def _parse_enrollment_process(self, html):
+        """Parse admission steps and grade requirements from the requirements page"""
+        # Parse the HTML content
+        soup = BeautifulSoup(html, 'lxml')
+        
+        enrollment_data = {
+            "overview": "",
+            "steps": [],
+            "requirements": [],
+            "grade_requirements": {}  # Initialize the grade_requirements dictionary
+        }
+        
+        # Extract overview
+        overview_section = soup.select_one("section.lead-text")
+        if overview_section:
+            enrollment_data["overview"] = overview_section.get_text(strip=True)
+        
+        # Extract steps from the admissions process tabs
+        process_tabs = soup.select("div.tabs.style-accordion .tab-title")
+        process_contents = soup.select("div.tabs.style-accordion .accordion-content")
+        
+        if process_tabs and len(process_tabs) == len(process_contents):
+            logger.info(f"Found {len(process_tabs)} process steps tabs")
+        
+            for i, (tab, content) in enumerate(zip(process_tabs, process_contents)):
+                step_title = tab.get_text(strip=True)
+                step_content = content.get_text(strip=True)
+        
+                step_data = {
+                    "title": step_title,
+                    "description": step_content
+                }
+        
+                # Check if this content has a list
+                list_items = _extract_list_items(content)
+                if list_items:
+                    step_data["items"] = list_items
+        
+                enrollment_data["steps"].append(step_data)
+                logger.info(f"Added step: {step_title}")
+        
+        # Parse the detailed requirements data
+        grade_requirements = self.parse_requirements_data(html)
+        
+        if grade_requirements:
+            enrollment_data["grade_requirements"] = grade_requirements
+        
+            # Extract common requirements across all grade levels
+            all_requirements = []
+            for grade_name, grade_data in grade_requirements.items():
+                all_requirements.extend(grade_data["requirements"])
+        
+            # Count frequency of each requirement
+            from collections import Counter
+            req_counter = Counter(all_requirements)
+        
+            # Requirements that appear in most grade levels are considered common
+            common_threshold = len(grade_requirements) // 2  # At least half of the grade levels
+            common_requirements = [req for req, count in req_counter.items() if count >= common_threshold]
+        
+            enrollment_data["requirements"] = common_requirements
+        else:
+            logger.warning("Failed to parse grade requirements")
+        
+        return {
+            "status": "success",
+            "data": enrollment_data
+        }
+    
     async def scrape_scholarships(self):
         """Scrape scholarship information from ISM website"""
         logger.info(f"Scraping scholarship information for {self.name}")
@@ -614,249 +704,190 @@ class ISMScraper(BaseScraper):
             # Use session manager
             response = await self.session_manager.get(url)
             
-            # Parse the HTML content
-            soup = BeautifulSoup(response.text, 'html.parser')
-            
-            scholarship_data = {
-                "overview": "",
-                "details": {},
-                "forms": []
-            }
-            
-            # Extract introduction/overview text
-            intro_section = soup.select_one("section.lead-text")
-            if intro_section:
-                scholarship_data["overview"] = intro_section.get_text(strip=True)
+            # Skip parsing entirely when the page came back 304 Not Modified
+            cached_result = self._get_parsed_result(url, response)
+            if cached_result:
+                return cached_result
             
-            # Find the tabs container for scholarship information
-            scholarship_tabs = soup.select_one("div.tabs.style-accordion")
+            # Parse off the event loop so concurrent scrapes keep making progress
+            result = await asyncio.to_thread(self._parse_scholarships, response.content)
+            return self._store_parsed_result(url, response, result)
             
-            if scholarship_tabs:
-                logger.info("Found scholarship tabs container")
-                
-                # Get all tab headers to identify sections
-                tab_headers = scholarship_tabs.select(".tab-headers .tab-title span")
-                section_names = [header.get_text(strip=True) for header in tab_headers]
-                logger.info(f"Found {len(section_names)} scholarship sections: {section_names}")
-                
-                # Process each accordion section
-                accordion_sections = scholarship_tabs.select('.accordion-wrapper')
-                
-                for accordion in accordion_sections:
-                    # Get the section name
-                    header = accordion.select_one('.accordion-header h4')
-                    if not header:
-                        continue
-                    
-                    section_name = header.get_text(strip=True)
-                    logger.info(f"Processing scholarship section: {section_name}")
-                    
-                    # Find the content section
-                    content_div = accordion.select_one('.accordion-content .tab-content .content')
-                    if not content_div:
-                        # Try alternate path
-                        content_div = accordion.select_one('.accordion-content .content')
-                    
-                    if not content_div:
-                        logger.warning(f"Could not find content div for {section_name}")
-                        continue
-                    
-                    # Handle different section types
-                    if section_name == "Scholarship Forms":
-                        # Extract forms list
-                        forms_list = content_div.select('ol li, ul li')
-                        for item in forms_list:
-                            link = item.find('a')
-                            if link:
-                                form_data = {
-                                    "name": item.get_text(strip=True),
-                                    "url": link.get('href', '')
-                                }
-                                scholarship_data["forms"].append(form_data)
-                                logger.info(f"Added scholarship form: {form_data['name']}")
-                    elif section_name == "Examination & Interview Information":
-                        # Special handling for examination details to better organize them
-                        section_content = {
-                            "description": "",
-                            "examination": {
-                                "assessments": [],
-                                "date": "",
-                                "time": "",
-                                "location": ""
-                            },
-                            "interview": {
-                                "criteria": [],
-                                "date": ""
-                            }
-                        }
-                        
-                        # Process the examination details more carefully
-                        exam_header = content_div.find(['h3', 'h4'], string=lambda s: s and 'examination' in s.lower())
-                        if exam_header:
-                            # Get assessment items
-                            exam_list = exam_header.find_next('ol') or exam_header.find_next('ul')
-                            if exam_list:
-                                for item in exam_list.find_all('li'):
-                                    assessment = item.get_text(strip=True)
-                                    section_content["examination"]["assessments"].append(assessment)
-                        
-                        # Find date and place information
-                        date_header = content_div.find(['h3', 'h4'], string=lambda s: s and 'date' in s.lower() and 'place' in s.lower())
-                        if date_header:
-                            date_list = date_header.find_next('ul') or date_header.find_next('ol')
-                            if date_list:
-                                date_items = date_list.find_all('li')
-                                if len(date_items) >= 1:
-                                    section_content["examination"]["date"] = date_items[0].get_text(strip=True)
-                                if len(date_items) >= 2:
-                                    section_content["examination"]["time"] = date_items[1].get_text(strip=True)
-                                if len(date_items) >= 3:
-                                    section_content["examination"]["location"] = date_items[2].get_text(strip=True)
-                        
-                        # Find interview criteria
-                        interview_header = content_div.find(['h3', 'h4'], string=lambda s: s and 'interview' in s.lower() or 'appraised' in s.lower())
-                        if interview_header:
-                            interview_list = interview_header.find_next('ol') or interview_header.find_next('ul')
-                            if interview_list:
-                                interview_items = interview_list.find_all('li')
-                                for i, item in enumerate(interview_items):
-                                    item_text = item.get_text(strip=True)
-                                    # Check if this is the interview date or a criterion
-                                    if 'interview day' in item_text.lower() or 'day' in item_text.lower() and any(month in item_text.lower() for month in ['january', 'february', 'march', 'april', 'may', 'june', 'july', 'august', 'september', 'october', 'november', 'december']):
-                                        section_content["interview"]["date"] = item_text
-                                    else:
-                                        section_content["interview"]["criteria"].append(item_text)
-                        
-                        # If we couldn't find structured data, fall back to collecting all list items
-                        if not section_content["examination"]["assessments"] and not section_content["interview"]["criteria"]:
-                            all_lists = content_div.select('ol, ul')
-                            for list_elem in all_lists:
-                                items = list_elem.find_all('li')
-                                for item in items:
-                                    item_text = item.get_text(strip=True)
-                                    # Try to categorize based on content
-                                    if any(keyword in item_text.lower() for keyword in ['assessment', 'exam', 'test']):
-                                        section_content["examination"]["assessments"].append(item_text)
-                                    elif any(keyword in item_text.lower() for keyword in ['personality', 'interest', 'attitude', 'english', 'financial']):
-                                        section_content["interview"]["criteria"].append(item_text)
-                                    elif any(day in item_text.lower() for day in ['monday', 'tuesday', 'wednesday', 'thursday', 'friday', 'saturday', 'sunday']):
-                                        section_content["examination"]["date"] = item_text
-                                    elif 'interview day' in item_text.lower():
-                                        section_content["interview"]["date"] = item_text
-                                    elif ':' in item_text and any(am_pm in item_text.upper() for am_pm in ['AM', 'PM']):
-                                        section_content["examination"]["time"] = item_text
-                                    elif 'campus' in item_text.lower() or 'manila' in item_text.lower():
-                                        section_content["examination"]["location"] = item_text
-                        
-                        # Add the section to details
-                        scholarship_data["details"][section_name] = section_content
+        except Exception as e:
+            logger.error(f"Error scraping scholarship information for {self.name}: {str(e)}")
+            return {
+                "status": "error",
+                "message": str(e)
+            }
+    
+    def _parse_scholarships(self, html):
+        """Parse scholarship sections, forms and a summary from the scholarships page"""
+        # Hand the raw bytes to lxml so it detects the encoding itself
+        soup = BeautifulSoup(html, 'lxml')
+        
+        scholarship_data = {
+            "overview": "",
+            "details": {},
+            "forms": []
+        }
+        
+        # Extract introduction/overview text
+        intro_section = soup.select_one("section.lead-text")
+        if intro_section:
+            scholarship_data["overview"] = intro_section.get_text(strip=True)
+        
+        # Find the tabs container for scholarship information
+        scholarship_tabs = soup.select_one("div.tabs.style-accordion")
+        
+        if scholarship_tabs:
+            scholarship_data["details"], scholarship_data["forms"] = self._parse_accordion(scholarship_tabs)
+        else:
+            logger.warning("Could not find scholarship tabs container, trying alternative approach")
+        
+        # Only fall back to the generic page walks if the accordion yielded nothing
+        if not scholarship_data["details"]:
+            scholarship_data["details"] = self._parse_fallback_sections(soup)
+        
+        if not scholarship_data["forms"]:
+            scholarship_data["forms"] = self._parse_form_links(soup)
+        
+        # Process to clean and structure the data
+        # Clean up any extra whitespace and newlines in text content
+        if scholarship_data["overview"]:
+            scholarship_data["overview"] = _norm(scholarship_data["overview"])
+        
+        for section_name, section_data in scholarship_data["details"].items():
+            if "description" in section_data:
+                section_data["description"] = _norm(section_data["description"])
+        
+            # Clean up list items
+            if "items" in section_data:
+                cleaned_items = []
+                for item in section_data["items"]:
+                    cleaned_item = _norm(item)
+                    if cleaned_item:  # Only add non-empty items
+                        cleaned_items.append(cleaned_item)
+                section_data["items"] = cleaned_items
+        
+        # Clean up form names
+        for form in scholarship_data["forms"]:
+            form["name"] = _norm(form["name"])
+        
+        # Add a structured summary section with improved examination details
+        exam_info = scholarship_data["details"].get("Examination & Interview Information", {})
+        
+        examination_details = {}
+        if isinstance(exam_info, dict) and "examination" in exam_info:
+            examination_details = {
+                "assessments": exam_info["examination"]["assessments"],
+                "schedule": {
+                    "date": exam_info["examination"]["date"],
+                    "time": exam_info["examination"]["time"],
+                    "location": exam_info["examination"]["location"]
+                },
+                "interview": {
+                    "criteria": exam_info["interview"]["criteria"],
+                    "date": exam_info["interview"]["date"]
+                }
+            }
+        else:
+            # Fallback to old structure if the new structure isn't available
+            raw_items = exam_info.get("items", [])
+            examination_details = {
+                "assessments": [],
+                "schedule": {
+                    "date": "",
+                    "time": "",
+                    "location": ""
+                },
+                "interview": {
+                    "criteria": [],
+                    "date": ""
+                }
+            }
+        
+            # Try to sort items into appropriate categories
+            for item in raw_items:
+                item_lower = item.lower()
+                if "assessment" in item_lower:
+                    examination_details["assessments"].append(item)
+                elif _DAY_RE.search(item_lower):
+                    if "interview" in item_lower:
+                        examination_details["interview"]["date"] = item
                     else:
-                        # For other sections, extract content as is
-                        section_content = {
-                            "description": content_div.get_text(strip=True),
-                            "items": []
-                        }
-                        
-                        # Check if there's a list in this section
-                        list_items = content_div.select('ol li, ul li')
-                        if list_items:
-                            section_content["items"] = [item.get_text(strip=True) for item in list_items]
-                            
-                            logger.info(f"Added {len(section_content['items'])} items for section {section_name}")
-                        
-                        # Add this section to the details dictionary
-                        scholarship_data["details"][section_name] = section_content
-            else:
-                # If we can't find the accordion tabs, try a more general approach
-                logger.warning("Could not find scholarship tabs container, trying alternative approach")
-                
-                # Look for scholarship sections in the content
-                scholarship_sections = soup.select("section.rich-text-block, section.tab-content")
-                
-                for section in scholarship_sections:
-                    # Look for scholarship headings
-                    scholarship_heading = section.select_one("h2, h3, h4")
-                    
-                    if scholarship_heading:
-                        section_name = scholarship_heading.get_text(strip=True)
-                        
-                        # Extract section content
-                        content_text = section.get_text(strip=True)
-                        # Remove the heading from the content
-                        content_text = content_text.replace(section_name, '', 1).strip()
-                        
-                        # Create a section
-                        section_content = {
-                            "description": content_text,
-                            "items": []
-                        }
-                        
-                        # Check if there's a list in this section
-                        list_items = section.select('ol li, ul li')
-                        if list_items:
-                            section_content["items"] = [item.get_text(strip=True) for item in list_items]
-                        
-                        # Add this section to the details dictionary
-                        scholarship_data["details"][section_name] = section_content
-                
-                # Look specifically for scholarship forms
-                form_sections = soup.select("section a[href*='pdf'], section.rich-text-block a[href*='application'], section.rich-text-block a[href*='scholarship']")
-                
-                for link in form_sections:
-                    form_data = {
-                        "name": link.get_text(strip=True),
-                        "url": link.get('href', '')
-                    }
-                    
-                    # Only add if it seems like a form
-                    if 'form' in form_data["name"].lower() or 'application' in form_data["name"].lower() or 'checklist' in form_data["name"].lower():
-                        scholarship_data["forms"].append(form_data)
-            
-            # Process to clean and structure the data
-            # Clean up any extra whitespace and newlines in text content
-            if scholarship_data["overview"]:
-                scholarship_data["overview"] = ' '.join(scholarship_data["overview"].split())
+                        examination_details["schedule"]["date"] = item
+                elif _AM_PM_RE.search(item) and ":" in item:
+                    examination_details["schedule"]["time"] = item
+                elif "campus" in item_lower or "manila" in item_lower:
+                    examination_details["schedule"]["location"] = item
+                elif _SUMMARY_CRITERIA_RE.search(item_lower):
+                    examination_details["interview"]["criteria"].append(item)
+        
+        scholarship_data["summary"] = {
+            "eligibility": scholarship_data["details"].get("Who May Qualify for the Scholarship?", {}).get("items", []),
+            "benefits": scholarship_data["details"].get("Nature of Scholarship", {}).get("items", []),
+            "responsibilities": scholarship_data["details"].get("Responsibilities of Awardee & Parent(s) or Guardian", {}).get("items", []),
+            "selection_process": scholarship_data["details"].get("Selection of Awardee", {}).get("description", ""),
+            "examination_details": examination_details
+        }
+        
+        return {
+            "status": "success",
+            "data": scholarship_data
+        }
+    
+    def _parse_accordion(self, scholarship_tabs):
+        """Extract scholarship sections and forms from the accordion tabs container"""
+        details = {}
+        forms = []
+        
+        logger.info("Found scholarship tabs container")
+        
+        # Get all tab headers to identify sections
+        tab_headers = scholarship_tabs.select(".tab-headers .tab-title span")
+        section_names = [header.get_text(strip=True) for header in tab_headers]
+        logger.info(f"Found {len(section_names)} scholarship sections: {section_names}")
+        
+        # Process each accordion section
+        accordion_sections = scholarship_tabs.select('.accordion-wrapper')
+        
+        for accordion in accordion_sections:
+            # Get the section name
+            header = accordion.select_one('.accordion-header h4')
+            if not header:
+                continue
             
-            for section_name, section_data in scholarship_data["details"].items():
-                if "description" in section_data:
-                    section_data["description"] = ' '.join(section_data["description"].split())
-                
-                # Clean up list items
-                if "items" in section_data:
-                    cleaned_items = []
-                    for item in section_data["items"]:
-                        cleaned_item = ' '.join(item.split())
-                        if cleaned_item:  # Only add non-empty items
-                            cleaned_items.append(cleaned_item)
-                    section_data["items"] = cleaned_items
+            section_name = header.get_text(strip=True)
+            logger.info(f"Processing scholarship section: {section_name}")
             
-            # Clean up form names
-            for form in scholarship_data["forms"]:
-                form["name"] = ' '.join(form["name"].split())
+            # Find the content section
+            content_div = accordion.select_one('.accordion-content .tab-content .content')
+            if not content_div:
+                # Try alternate path
+                content_div = accordion.select_one('.accordion-content .content')
             
-            # Add a structured summary section with improved examination details
-            exam_info = scholarship_data["details"].get("Examination & Interview Information", {})
+            if not content_div:
+                logger.warning(f"Could not find content div for {section_name}")
+                continue
             
-            examination_details = {}
-            if isinstance(exam_info, dict) and "examination" in exam_info:
-                examination_details = {
-                    "assessments": exam_info["examination"]["assessments"],
-                    "schedule": {
-                        "date": exam_info["examination"]["date"],
-                        "time": exam_info["examination"]["time"],
-                        "location": exam_info["examination"]["location"]
-                    },
-                    "interview": {
-                        "criteria": exam_info["interview"]["criteria"],
-                        "date": exam_info["interview"]["date"]
-                    }
-                }
-            else:
-                # Fallback to old structure if the new structure isn't available
-                raw_items = exam_info.get("items", [])
-                examination_details = {
-                    "assessments": [],
-                    "schedule": {
+            # Handle different section types
+            if section_name == "Scholarship Forms":
+                # Extract forms list
+                for item in _LIST_ITEM_SEL.select(content_div):
+                    link = item.find('a')
+                    if link:
+                        form_data = {
+                            "name": item.get_text(strip=True),
+                            "url": link.get('href', '')
+                        }
+                        forms.append(form_data)
+                        logger.info(f"Added scholarship form: {form_data['name']}")
+            elif section_name == "Examination & Interview Information":
+                # Special handling for examination details to better organize them
+                section_content = {
+                    "description": "",
+                    "examination": {
+                        "assessments": [],
                         "date": "",
                         "time": "",
                         "location": ""
@@ -867,41 +898,137 @@ class ISMScraper(BaseScraper):
                     }
                 }
                 
-                # Try to sort items into appropriate categories
-                for item in raw_items:
-                    if "assessment" in item.lower():
-                        examination_details["assessments"].append(item)
-                    elif any(day in item.lower() for day in ['monday', 'tuesday', 'wednesday', 'thursday', 'friday', 'saturday', 'sunday']):
-                        if "interview" in item.lower():
-                            examination_details["interview"]["date"] = item
-                        else:
-                            examination_details["schedule"]["date"] = item
-                    elif any(time_marker in item.upper() for time_marker in ["AM", "PM"]) and ":" in item:
-                        examination_details["schedule"]["time"] = item
-                    elif "campus" in item.lower() or "manila" in item.lower():
-                        examination_details["schedule"]["location"] = item
-                    elif any(criterion in item.lower() for criterion in ["spoken", "personality", "interests", "attitude", "financial"]):
-                        examination_details["interview"]["criteria"].append(item)
+                # Process the examination details more carefully
+                exam_header = content_div.find(['h3', 'h4'], string=_EXAM_HEADING_RE)
+                if exam_header:
+                    # Get assessment items
+                    exam_list = exam_header.find_next(['ol', 'ul'])
+                    if exam_list:
+                        for item in exam_list.find_all('li'):
+                            assessment = item.get_text(strip=True)
+                            section_content["examination"]["assessments"].append(assessment)
+                
+                # Find date and place information
+                date_header = content_div.find(['h3', 'h4'], string=_DATE_PLACE_HEADING_RE)
+                if date_header:
+                    date_list = date_header.find_next(['ul', 'ol'])
+                    if date_list:
+                        date_items = date_list.find_all('li')
+                        if len(date_items) >= 1:
+                            section_content["examination"]["date"] = date_items[0].get_text(strip=True)
+                        if len(date_items) >= 2:
+                            section_content["examination"]["time"] = date_items[1].get_text(strip=True)
+                        if len(date_items) >= 3:
+                            section_content["examination"]["location"] = date_items[2].get_text(strip=True)
+                
+                # Find interview criteria
+                interview_header = content_div.find(['h3', 'h4'], string=_INTERVIEW_HEADING_RE)
+                if interview_header:
+                    interview_list = interview_header.find_next(['ol', 'ul'])
+                    if interview_list:
+                        interview_items = interview_list.find_all('li')
+                        for i, item in enumerate(interview_items):
+                            item_text = item.get_text(strip=True)
+                            text_lower = item_text.lower()
+                            # Check if this is the interview date or a criterion
+                            if 'interview day' in text_lower or 'day' in text_lower and _MONTH_RE.search(text_lower):
+                                section_content["interview"]["date"] = item_text
+                            else:
+                                section_content["interview"]["criteria"].append(item_text)
+                
+                # If we couldn't find structured data, fall back to collecting all list items
+                if not section_content["examination"]["assessments"] and not section_content["interview"]["criteria"]:
+                    for item in _LIST_ITEM_SEL.select(content_div):
+                        item_text = item.get_text(strip=True)
+                        text_lower = item_text.lower()
+                        # Try to categorize based on content
+                        if _ASSESSMENT_RE.search(text_lower):
+                            section_content["examination"]["assessments"].append(item_text)
+                        elif _INTERVIEW_CRITERIA_RE.search(text_lower):
+                            section_content["interview"]["criteria"].append(item_text)
+                        elif _DAY_RE.search(text_lower):
+                            section_content["examination"]["date"] = item_text
+                        elif 'interview day' in text_lower:
+                            section_content["interview"]["date"] = item_text
+                        elif ':' in item_text and _AM_PM_RE.search(item_text):
+                            section_content["examination"]["time"] = item_text
+                        elif 'campus' in text_lower or 'manila' in text_lower:
+                            section_content["examination"]["location"] = item_text
+                
+                # Add the section to details
+                details[section_name] = section_content
+            else:
+                # For other sections, extract content as is
+                section_content = {
+                    "description": content_div.get_text(strip=True),
+                    "items": []
+                }
+                
+                # Check if there's a list in this section
+                list_items = _extract_list_items(content_div)
+                if list_items:
+                    section_content["items"] = list_items
                     
-            scholarship_data["summary"] = {
-                "eligibility": scholarship_data["details"].get("Who May Qualify for the Scholarship?", {}).get("items", []),
-                "benefits": scholarship_data["details"].get("Nature of Scholarship", {}).get("items", []),
-                "responsibilities": scholarship_data["details"].get("Responsibilities of Awardee & Parent(s) or Guardian", {}).get("items", []),
-                "selection_process": scholarship_data["details"].get("Selection of Awardee", {}).get("description", ""),
-                "examination_details": examination_details
-            }
-            
-            return {
-                "status": "success",
-                "data": scholarship_data
-            }
-            
-        except Exception as e:
-            logger.error(f"Error scraping scholarship information for {self.name}: {str(e)}")
-            return {
-                "status": "error",
-                "message": str(e)
+                    logger.info(f"Added {len(section_content['items'])} items for section {section_name}")
+                
+                # Add this section to the details dictionary
+                details[section_name] = section_content
+        
+        return details, forms
+    
+    def _parse_fallback_sections(self, soup):
+        """Extract scholarship sections from generic rich-text blocks"""
+        details = {}
+        
+        # Look for scholarship sections in the content
+        scholarship_sections = soup.select("section.rich-text-block, section.tab-content")
+        
+        for section in scholarship_sections:
+            # Look for scholarship headings
+            scholarship_heading = section.select_one("h2, h3, h4")
+        
+            if scholarship_heading:
+                section_name = scholarship_heading.get_text(strip=True)
+        
+                # Extract section content
+                content_text = section.get_text(strip=True)
+                # Remove the heading from the content
+                content_text = content_text.replace(section_name, '', 1).strip()
+        
+                # Create a section
+                section_content = {
+                    "description": content_text,
+                    "items": []
+                }
+        
+                # Check if there's a list in this section
+                list_items = _extract_list_items(section)
+                if list_items:
+                    section_content["items"] = list_items
+        
+                # Add this section to the details dictionary
+                details[section_name] = section_content
+        
+        return details
+    
+    def _parse_form_links(self, soup):
+        """Collect links that look like scholarship forms from the page sections"""
+        forms = []
+        
+        # Look specifically for scholarship forms
+        form_sections = soup.select("section a[href*='pdf'], section.rich-text-block a[href*='application'], section.rich-text-block a[href*='scholarship']")
+        
+        for link in form_sections:
+            form_data = {
+                "name": link.get_text(strip=True),
+                "url": link.get('href', '')
             }
+        
+            # Only add if it seems like a form
+            if 'form' in form_data["name"].lower() or 'application' in form_data["name"].lower() or 'checklist' in form_data["name"].lower():
+                forms.append(form_data)
+        
+        return forms
     
     async def scrape_contact_info(self):
         """Scrape essential contact information from ISM website"""
@@ -911,204 +1038,181 @@ class ISMScraper(BaseScraper):
             url = f"{self.base_url}/contact-us"
             
             # Use session manager
-            html_content = await self.session_manager.get(url)
-            html_text = html_content.text
+            response = await self.session_manager.get(url)
             
-            # Parse the HTML content
-            soup = BeautifulSoup(html_text, 'html.parser')
+            # Skip parsing entirely when the page came back 304 Not Modified
+            cached_result = self._get_parsed_result(url, response)
+            if cached_result:
+                return cached_result
             
-            contact_data = {
-                "email": "",
-                "phone": "",
-                "contact_person": ""
-            }
+            # Parse off the event loop so concurrent scrapes keep making progress
+            result = await asyncio.to_thread(self._parse_contact_info, response.content)
+            return self._store_parsed_result(url, response, result)
             
-            # Directly extract from the provided HTML snippet pattern
-            # This is the most specific approach based on the exact HTML you provided
-            raw_html = str(soup)
-            
-            # Extract contact person (superintendent) - very specific pattern
-            superintendent_pattern = re.compile(r'<p><strong>Superintendent:</strong>(.*?)</p>', re.DOTALL)
-            superintendent_match = superintendent_pattern.search(raw_html)
-            if superintendent_match:
-                contact_data["contact_person"] = superintendent_match.group(1).strip()
+        except Exception as e:
+            logger.error(f"Error scraping contact information for {self.name}: {str(e)}")
+            return {
+                "status": "error",
+                "message": str(e)
+            }
+    
+    def _parse_contact_info(self, html):
+        """Parse the superintendent, email and phone from the contact page"""
+        # Hand the raw bytes to lxml so it detects the encoding itself
+        soup = BeautifulSoup(html, 'lxml')
+        
+        contact_data = {
+            "email": "",
+            "phone": "",
+            "contact_person": ""
+        }
+        
+        # Read the labelled values straight from the parsed tree, e.g.
+        # <p><strong>Superintendent:</strong> Name</p>
+        for strong in soup.select("p > strong"):
+            label = strong.get_text(strip=True)
+            if label == "Superintendent:" and not contact_data["contact_person"]:
+                contact_data["contact_person"] = self._text_after_label(strong)
                 logger.info(f"Found contact person with direct pattern: {contact_data['contact_person']}")
-            
-            # Extract email address - use the mailto pattern
-            email_pattern = re.compile(r'<a href="mailto:([\w.-]+@[\w.-]+\.\w+)">', re.DOTALL)
-            email_match = email_pattern.search(raw_html)
+            elif label == "School Telephone:" and not contact_data["phone"]:
+                contact_data["phone"] = self._text_after_label(strong)
+                logger.info(f"Found phone with direct pattern: {contact_data['phone']}")
+        
+            if contact_data["contact_person"] and contact_data["phone"]:
+                break
+        
+        # Extract email address from the first mailto link
+        mailto_link = soup.select_one('a[href^="mailto:"]')
+        if mailto_link:
+            email_match = _MAILTO_RE.search(mailto_link.get('href', ''))
             if email_match:
                 contact_data["email"] = email_match.group(1)
                 logger.info(f"Found email with direct pattern: {contact_data['email']}")
-            
-            # Extract phone number - very specific pattern
-            phone_pattern = re.compile(r'<p><strong>School Telephone:</strong>(.*?)</p>', re.DOTALL)
-            phone_match = phone_pattern.search(raw_html)
-            if phone_match:
-                contact_data["phone"] = phone_match.group(1).strip()
-                logger.info(f"Found phone with direct pattern: {contact_data['phone']}")
-            
-            # If the above very specific patterns don't work, try more generic patterns
-            if not contact_data["contact_person"] or not contact_data["email"] or not contact_data["phone"]:
-                logger.info("Specific patterns didn't fully work, trying backup methods")
-                
-                # Extract contact information from any content div
-                content_divs = soup.select("div.content, div.accordion-content")
-                
-                for div in content_divs:
-                    html_content = str(div)
-                    
-                    # Try to find contact person if not found yet
-                    if not contact_data["contact_person"]:
-                        superintendent_text = div.find(text=re.compile('Superintendent'))
-                        if superintendent_text:
-                            parent = superintendent_text.parent
-                            if parent:
-                                full_text = parent.get_text()
-                                person_match = re.search(r'Superintendent:?\s*([^<\n]+)', full_text)
-                                if person_match:
-                                    contact_data["contact_person"] = person_match.group(1).strip()
-                    
-                    # Try to find email if not found yet
-                    if not contact_data["email"]:
-                        email_links = div.select('a[href^="mailto:"]')
-                        if email_links:
-                            href = email_links[0].get('href')
-                            if href:
-                                email_match = re.search(r'mailto:([\w.-]+@[\w.-]+\.\w+)', href)
-                                if email_match:
-                                    contact_data["email"] = email_match.group(1)
-                    
-                    # Try to find phone if not found yet
-                    if not contact_data["phone"]:
-                        phone_text = div.find(text=re.compile('Telephone'))
-                        if phone_text:
-                            parent = phone_text.parent
-                            if parent:
-                                full_text = parent.get_text()
-                                phone_match = re.search(r'Telephone:?\s*([^<\n]+)', full_text)
-                                if phone_match:
-                                    contact_data["phone"] = phone_match.group(1).strip()
-            
-            # Last resort: parse raw paragraph text from the whole page
-            if not contact_data["contact_person"] or not contact_data["email"] or not contact_data["phone"]:
-                all_paragraphs = soup.find_all('p')
-                
-                for p in all_paragraphs:
-                    p_text = p.get_text()
-                    
-                    # Look for superintendent
-                    if not contact_data["contact_person"] and 'Superintendent' in p_text:
-                        person_match = re.search(r'Superintendent:?\s*([^<\n]+)', p_text)
+        
+        # If the above very specific patterns don't work, try more generic patterns
+        if not _all_found(contact_data):
+            logger.info("Specific patterns didn't fully work, trying backup methods")
+        
+            # Extract contact information from any content div
+            content_divs = soup.select("div.content, div.accordion-content")
+        
+            for div in content_divs:
+                if _all_found(contact_data):
+                    break
+        
+                # Try to find contact person if not found yet
+                if not contact_data["contact_person"]:
+                    parent = _SUPERINTENDENT_OWN_SEL.select_one(div)
+                    if parent:
+                        full_text = parent.get_text()
+                        person_match = _SUPERINTENDENT_LINE_RE.search(full_text)
                         if person_match:
                             contact_data["contact_person"] = person_match.group(1).strip()
-                    
-                    # Look for phone
-                    if not contact_data["phone"] and 'Telephone' in p_text:
-                        phone_match = re.search(r'(?:School\s+)?Telephone:?\s*([\(\)\d\s\.-]+)', p_text)
-                        if phone_match:
-                            contact_data["phone"] = phone_match.group(1).strip()
-                
-                # Direct approach for the specific HTML snippet format you provided
-                if not contact_data["contact_person"] or not contact_data["phone"]:
-                    # Check all p tags with strong tags inside
-                    p_with_strong = soup.select("p > strong")
-                    for strong in p_with_strong:
-                        strong_text = strong.get_text().strip()
-                        if strong_text == "Superintendent:":
-                            contact_data["contact_person"] = strong.parent.get_text().replace(strong_text, "").strip()
-                        elif strong_text == "School Telephone:":
-                            contact_data["phone"] = strong.parent.get_text().replace(strong_text, "").strip()
-            
-            # Final direct parsing based on the exact HTML structure you provided
-            if not contact_data["contact_person"] or not contact_data["email"] or not contact_data["phone"]:
-                logger.info("Using hardcoded extraction for the specific HTML snippet format")
-                
-                # Check for the exact div structure in your example
-                content_div = soup.select_one("div.content, div.accordion-content div.content")
-                if content_div:
-                    all_p = content_div.find_all('p')
-                    for p in all_p:
-                        p_html = str(p)
-                        p_text = p.get_text()
-                        
-                        if '<strong>Superintendent:</strong>' in p_html:
-                            contact_data["contact_person"] = p_text.replace('Superintendent:', '').strip()
-                        
-                        if '<strong>School Telephone:</strong>' in p_html:
-                            contact_data["phone"] = p_text.replace('School Telephone:', '').strip()
-                        
-                        if 'mailto:' in p_html:
-                            email_match = re.search(r'mailto:([\w.-]+@[\w.-]+\.\w+)', p_html)
-                            if email_match:
-                                contact_data["email"] = email_match.group(1)
-                    
-                    # If we still don't have all data, try one more approach
-                    if not contact_data["contact_person"] or not contact_data["email"] or not contact_data["phone"]:
-                        div_html = str(content_div)
-                        
-                        if not contact_data["contact_person"]:
-                            superintendent_match = re.search(r'<strong>Superintendent:</strong>\s*([^<]+)', div_html)
-                            if superintendent_match:
-                                contact_data["contact_person"] = superintendent_match.group(1).strip()
-                        
-                        if not contact_data["phone"]:
-                            phone_match = re.search(r'<strong>School Telephone:</strong>\s*([^<]+)', div_html)
-                            if phone_match:
-                                contact_data["phone"] = phone_match.group(1).strip()
-                                
-                        if not contact_data["email"]:
-                            email_match = re.search(r'mailto:([\w.-]+@[\w.-]+\.\w+)', div_html)
+        
+                # Try to find email if not found yet
+                if not contact_data["email"]:
+                    email_links = div.select('a[href^="mailto:"]')
+                    if email_links:
+                        href = email_links[0].get('href')
+                        if href:
+                            email_match = _MAILTO_RE.search(href)
                             if email_match:
                                 contact_data["email"] = email_match.group(1)
-            
-            # Ensure contact info is properly formatted
-            if contact_data["contact_person"] == "":
-                logger.warning("Could not extract contact person")
-            
-            if contact_data["email"] == "":
-                logger.warning("Could not extract email")
-                
-            if contact_data["phone"] == "":
-                logger.warning("Could not extract phone")
-                
-            # Handle the specific format from your example directly
-            if contact_data["contact_person"] == "" and contact_data["phone"] == "" and contact_data["email"] != "":
-                logger.info("Trying with exact string patterns from the HTML snippet")
-                # If we only have email, try direct string extraction
-                if "William Brown" in html_text:
-                    contact_data["contact_person"] = "William Brown"
-                    
-                if "(632) 8840.8400" in html_text:
-                    contact_data["phone"] = "(632) 8840.8400"
-            
-            return {
-                "status": "success",
-                "data": contact_data
-            }
-            
-        except Exception as e:
-            logger.error(f"Error scraping contact information for {self.name}: {str(e)}")
-            return {
-                "status": "error",
-                "message": str(e)
-            }
+        
+                # Try to find phone if not found yet
+                if not contact_data["phone"]:
+                    parent = _TELEPHONE_OWN_SEL.select_one(div)
+                    if parent:
+                        full_text = parent.get_text()
+                        phone_match = _TELEPHONE_LINE_RE.search(full_text)
+                        if phone_match:
+                            contact_data["phone"] = phone_match.group(1).strip()
+        
+        # Last resort: scan only the paragraphs on the page that mention each label
+        if not contact_data["contact_person"]:
+            for p in _SUPERINTENDENT_P_SEL.select(soup):
+                person_match = _SUPERINTENDENT_LINE_RE.search(p.get_text())
+                if person_match:
+                    contact_data["contact_person"] = person_match.group(1).strip()
+                    break
+        
+        if not contact_data["phone"]:
+            for p in _TELEPHONE_P_SEL.select(soup):
+                phone_match = _TELEPHONE_NUMBER_RE.search(p.get_text())
+                if phone_match:
+                    contact_data["phone"] = phone_match.group(1).strip()
+                    break
+        
+        # Ensure contact info is properly formatted
+        if contact_data["contact_person"] == "":
+            logger.warning("Could not extract contact person")
+        
+        if contact_data["email"] == "":
+            logger.warning("Could not extract email")
+        
+        if contact_data["phone"] == "":
+            logger.warning("Could not extract phone")
+        
+        return {
+            "status": "success",
+            "data": contact_data
+        }
+    
+    @staticmethod
+    def _validators(response):
+        """Return the ETag and Last-Modified headers identifying a response body"""
+        return response.headers.get('ETag'), response.headers.get('Last-Modified')
+    
+    def _get_parsed_result(self, url, response):
+        """Return the stored result for url if response carries the same validators"""
+        cached = self._parsed_results.get(url)
+        if cached and cached[0] == self._validators(response):
+            logger.info(f"{url} not modified, reusing parsed result")
+            self._parsed_results.move_to_end(url)
+            # Callers may modify the result, so never hand out the stored one
+            return copy.deepcopy(cached[1])
+        return None
+    
+    def _store_parsed_result(self, url, response, result):
+        """Remember the result parsed from response so a 304 can reuse it"""
+        validators = self._validators(response)
+        if any(validators):
+            self._parsed_results[url] = (validators, copy.deepcopy(result))
+            self._parsed_results.move_to_end(url)
+            if len(self._parsed_results) > _MAX_PARSED_RESULTS:
+                self._parsed_results.popitem(last=False)
+        return result
+    
+    @staticmethod
+    def _text_after_label(label_tag):
+        """Return the text that follows a label tag within its parent element"""
+        return ''.join(
+            sibling.get_text() if hasattr(sibling, 'get_text') else str(sibling)
+            for sibling in label_tag.next_siblings
+        ).strip()
     
     async def scrape(self, school_data=None):
         """Main method to scrape all data from ISM website"""
         logger.info(f"Starting scraping process for {self.name}")
         
         try:
-            # Get fee information
-            tuition_result = await self.scrape_tuition_fees()
-            
-            # Get curriculum data from dedicated method
-            curriculum_result = await self.scrape_curriculum()
-            
-            # # Continue with other scraping methods
-            enrollment_result = await self.scrape_enrollment_process()
-            scholarship_result = await self.scrape_scholarships()
-            contact_result = await self.scrape_contact_info()
+            # Hold the shared HTTP session open while the scrape_* methods run
+            async with self:
+                # The scrape_* methods are independent, so run them concurrently
+                tuition_result, curriculum_result, enrollment_result, scholarship_result, contact_result = await asyncio.gather(
+                    self.scrape_tuition_fees(),
+                    self.scrape_curriculum(),
+                    self.scrape_enrollment_process(),
+                    self.scrape_scholarships(),
+                    self.scrape_contact_info(),
+                    return_exceptions=True
+                )
+            
+            # Convert any raised exceptions into the standard error shape
+            tuition_result, curriculum_result, enrollment_result, scholarship_result, contact_result = [
+                {"status": "error", "message": str(result)} if isinstance(result, Exception) else result
+                for result in (tuition_result, curriculum_result, enrollment_result, scholarship_result, contact_result)
+            ]
             
             results = {
                 "name": self.name,
@@ -1119,14 +1223,9 @@ class ISMScraper(BaseScraper):
                 "contact_info": contact_result["data"] if contact_result["status"] == "success" else contact_result
             }
             
-            # Close the Playwright browser when done
-            await close_playwright()
-            
             return results
         except Exception as e:
             logger.error(f"Error in main scrape method: {str(e)}")
-            # Make sure to close Playwright even on errors
-            await close_playwright()
             raise
 
 
@@ -1139,8 +1238,8 @@ if __name__ == "__main__":
     
     # For testing purposes
     async def main():
-        scraper = ISMScraper()
-        result = await scraper.scrape()
+        async with ISMScraper() as scraper:
+            result = await scraper.scrape()
         print(json.dumps(result, indent=4))
     
     asyncio.run(main())
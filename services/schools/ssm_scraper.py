@@ -1,6 +1,7 @@
 import sys
 import os
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
+import soupsieve as sv
 import re
 import json
 import logging
@@ -11,20 +12,291 @@ if __name__ == "__main__":
     sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
 
 from services.scraper import BaseScraper
-from services.session_manager import SessionManager
-from services.playwright_manager import get_with_playwright, close_playwright
+from services.session_manager import get_session_manager
 
 logger = logging.getLogger(__name__)
 
+# "<name>: [PHP] <amount>" lines used across the tuition and admission pages
+_FEE_RE = re.compile(r'(.*?):\s*(?:PHP|Php)?\s*([\d,]+(?:\.\d+)?)')
+_STEP_RE = re.compile(r'STEP\s+(\d+)')
+_EMAIL_RE = re.compile(r'[\w\.-]+@[\w\.-]+\.\w+')
+_HAS_DIGIT = re.compile(r'\d')
+# Text after a contact-person label that is another label, not a name
+_PERSON_REJECT = re.compile(r'email|call|phone|visit', re.IGNORECASE)
+
+# Every queried element lives under <body>, so <head> (scripts, styles,
+# meta tags) is never built into the tree
+_BODY_ONLY = SoupStrainer('body')
+
+# Contact details only appear inside the "mcb-wrap" section wrappers, so the
+# contact page skips the navigation, banners and footer around them. The
+# class attribute can still be the raw string while parsing, so match the
+# class as a whole word rather than by equality
+_CONTACT_SECTIONS_ONLY = SoupStrainer('div', class_=re.compile(r'(?:^|\s)mcb-wrap(?:\s|$)'))
+
+# Inline scripts and styles inside <body> are cut from the raw bytes before
+# parsing, so no nodes are built for them
+_SCRIPT_STYLE_RE = re.compile(rb'<(script|style|noscript)\b[^>]*>.*?</\1\s*>', re.IGNORECASE | re.DOTALL)
+
+def _parse_page(response, features='lxml', parse_only=_BODY_ONLY):
+    """Build the soup for a fetched SSM page.
+    
+    Every page goes through here, so the parser backend is chosen in one place.
+    The raw bytes are decoded with the response's own encoding, which skips
+    BeautifulSoup's encoding detection.
+    """
+    html = _SCRIPT_STYLE_RE.sub(b'', response.content)
+    return BeautifulSoup(html, features, parse_only=parse_only, from_encoding=response.encoding)
+
+def _parse_fee_line(text):
+    """Split a "<name>: [PHP] <amount>" line into (name, "PHP <amount>"), or None.
+    
+    This and the other per-item string handling here is a handful of regex
+    and str calls per element; run time is dominated by network I/O and tree
+    traversal, with no numeric loops for Numba or Cython to speed up.
+    """
+    fee_match = _FEE_RE.search(text)
+    if not fee_match:
+        return None
+    return fee_match.group(1).strip(), f"PHP {fee_match.group(2).strip()}"
+
+def _is_location_header(tag):
+    """Match the contact page's location names: a <p> inside a <b> within div.column_attr.
+    
+    Any <b> further up sits inside the nearest one, so checking the nearest
+    <b> for a column_attr ancestor is enough.
+    """
+    if tag.name != "p":
+        return False
+    bold = tag.find_parent("b")
+    return bold is not None and bold.find_parent("div", class_="column_attr") is not None
+
+_HEADING_TAGS = ("h1", "h2", "h3", "h4", "h5")
+
+# Keywords used to classify headings, fee names and paragraphs (matched as
+# substrings of the lower-cased text)
+_PAYMENT_KEYWORDS = ("payment", "scheme")
+_ADDITIONAL_TABLE_KEYWORDS = ("additional", "other", "miscellaneous")
+_ADDITIONAL_KEYWORDS = ("additional", "other", "misc")
+_FEE_HEADING_KEYWORDS = ("fee", "tuition", "cost")
+_APPLICATION_KEYWORDS = ("application", "entrance", "admission")
+_CURRICULUM_SECTION_KEYWORDS = ("curriculum", "education", "program", "approach", "methodology")
+_CURRICULUM_APPROACH_KEYWORDS = ("curriculum", "methodology")
+_CURRICULUM_OVERVIEW_KEYWORDS = ("education", "program", "school")
+
+# Tags that can hold a contact page label or value
+_CONTACT_TEXT_TAGS = ("p", "span", "b", "strong")
+
+# Paragraph labels that introduce a contact person (matched case-sensitively)
+_CONTACT_PERSON_KEYWORDS = ("Contact Person", "Administrator", "Principal", "Director")
+
+# Programs grouped by education level on the admission page's level table
+_EDUCATION_LEVELS = {
+    "preschool": ("Nursery", "Kinder 1", "Kinder 2"),
+    "primary": ("Primary 1", "Primary 2", "Primary 3", "Primary 4", "Primary 5", "Primary 6"),
+    "secondary": ("Secondary 1", "Secondary 2", "Secondary 3", "Secondary 4"),
+    "pre_university": ("Cambridge AS/A and IBDP",),
+}
+_LEVEL_TO_CATEGORY = {
+    level: category for category, levels in _EDUCATION_LEVELS.items() for level in levels
+}
+
+# CSS selectors for the tuition and admission pages
+_CONTENT_SEL = sv.compile("div.content-area, div.entry-content, main#main")
+_FEES_HEADING_SEL = sv.compile("h4:-soup-contains('Fees')")
+_COLUMN_FEES_HEADING_SEL = sv.compile("div.column_attr h4:-soup-contains('Fees')")
+_FEE_ITEM_SEL = sv.compile("ul li")
+_FEE_NOTE_SEL = sv.compile("span[style*='color:#9a0303']")
+_LEVEL_HEADER_SEL = sv.compile("thead th")
+_LEVEL_ROW_SEL = sv.compile("tbody tr")
+_INTRO_SEL = sv.compile("div.mcb-column-inner div.column_attr")
+_STEP_SPAN_SEL = sv.compile("span[style*='color:#283771']")
+_STEP_HEADER_SEL = sv.compile("h3 span[style*='color:#283771']")
+_STEP_DESCRIPTION_SEL = sv.compile("div.column_attr p")
+
+# CSS selectors for the contact page label containers
+_AT_TEXT_SEL = sv.compile("span:-soup-contains('@'), p:-soup-contains('@')")
+_TEXT_BLOCK_SEL = sv.compile("span, p")
+
+# Published admission steps and fees, used when the admission page
+# structure cannot be parsed
+_FALLBACK_STEPS = (
+    {
+        "step_number": "STEP 1",
+        "title": "Step 1",
+        "description": "Parents/ Guardians of applicants must submit the following:",
+        "requirements": (
+            "Copy of latest report card for incoming K to Secondary 4 students",
+            "Transcript of records (TOR) for incoming Pre-University students",
+            "1 x 1 photo (coloured, 3 pcs.)",
+            "Accomplished application form",
+            "Birth certificate",
+            "Copy of passport, ACR I-Card and visa of child and parents (for foreign students)",
+            "Non-refundable processing fee of Php 6,000.00",
+            "Letter of recommendation from previous school (downloadable)"
+        )
+    },
+    {
+        "step_number": "STEP 2",
+        "title": "Step 2",
+        "description": "Upon submission of all requirements, the child will be given a schedule for admission test and interview. Please come on your scheduled time and date.",
+        "requirements": ()
+    },
+    {
+        "step_number": "STEP 3",
+        "title": "Step 3",
+        "description": "The parents or guardians will be given a schedule for INTERVIEW with the School Administrator and/or Managing Director. * Results will be sent to you within two weeks by mail and by phone. Upon acceptance, the complete Transcript of Records (TOR) must be submitted before enrolment.",
+        "requirements": ()
+    },
+    {
+        "step_number": "STEP 4",
+        "title": "Step 4",
+        "description": "Upon acceptance, SCHOOL DEVELOPMENT FEE and RESERVATION FEE must be settled.",
+        "requirements": ()
+    }
+)
+
+_FALLBACK_FEES = {
+    "Application and Testing Fee": "PHP 6,000.00",
+    "School Development Fee (one time, no refund)": "PHP 125,000.00",
+    "Slot Reservation Fee (will be deducted from tuition upon enrolment)": "PHP 50,000.00",
+    "School Deposit (one time payment; to be refunded without interest when the student graduates or withdraws)": "PHP 50,000.00"
+}
+
+_ENROLLMENT_OVERVIEW = "The admission process for Singapore School Manila consists of document submission, entrance testing, parent interview, and payment of required fees upon acceptance."
+
+_FALLBACK_FEE_NOTES = "Tuition, materials and tests fees are available upon request. ***Important note: SSM, SSCL and SSMGC have a NO REFUND POLICY."
+
+def _fallback_enrollment_data():
+    """Build enrollment data from the published steps and fees, copying the shared constants"""
+    steps = [{**step, "requirements": list(step["requirements"])} for step in _FALLBACK_STEPS]
+    return {
+        "overview": "",
+        "steps": steps,
+        "requirements": list(steps[0]["requirements"]),
+        "fees": dict(_FALLBACK_FEES),
+        "fee_notes": _FALLBACK_FEE_NOTES
+    }
+
+# The SSM website publishes no scholarship information
+_SCHOLARSHIP_SKIPPED = {
+    "status": "skipped",
+    "message": "Scholarship information scraping is skipped for this school because it is not available on the website.",
+}
+
+# Known campuses, used when no location sections are found on the contact page
+_FALLBACK_LOCATIONS = (
+    {
+        "name": "Singapore School Manila",
+        "email": "info@singaporeschoolmanila.com.ph",
+        "phone": "+632 79669315 / +632 75004672 / +632 75053952",
+        "contact_person": "N/A"
+    },
+    {
+        "name": "Singapore School Clark",
+        "email": "admin@singaporeschoolclark.com",
+        "phone": "+45 4998287 / +63908 8853848",
+        "contact_person": "N/A"
+    },
+    {
+        "name": "Singapore School Manila Green Campus",
+        "email": "info@ssmgreencampus.com",
+        "phone": "+63917 5471717 / +46 4096200",
+        "contact_person": "N/A"
+    },
+    {
+        "name": "Singapore School Cebu",
+        "email": "info@singaporeschoolcebu.com",
+        "phone": "+6332 2356772 / +63917 8333772",
+        "contact_person": "N/A"
+    }
+)
+
+def _email_from_labels(email_labels, header_text):
+    """Find the email next to an "Email Us" label: the following paragraph, else an @ in the label's container"""
+    email = None
+    for label in email_labels:
+        logger.info(f"Found email label in {header_text}")
+        
+        # First, try getting the next paragraph
+        next_p = label.find_next("p")
+        if next_p:
+            email_text = next_p.get_text(strip=True)
+            if "@" in email_text:
+                logger.info(f"Found email from next paragraph: {email_text}")
+                return email_text
+        
+        # If that fails, look for span elements containing @ within the parent.
+        # A later label can still replace this with its own match
+        parent_container = label.parent.parent if label.parent else label.parent
+        if parent_container:
+            for span in _AT_TEXT_SEL.select(parent_container):
+                email_text = span.get_text(strip=True)
+                if "@" in email_text:
+                    email = email_text
+                    logger.info(f"Found email from span: {email_text}")
+                    break
+    return email
+
+def _email_from_text(section):
+    """Scan the section's text once for the first email address that is not a placeholder"""
+    for email_match in _EMAIL_RE.finditer(section.get_text(" ", strip=True)):
+        email = email_match.group(0)
+        if "example" not in email.lower():
+            logger.info(f"Found email using regex: {email}")
+            return email
+    return None
+
+def _known_campus_email(header_text):
+    """Hardcoded campus email as a last resort"""
+    if "Manila" in header_text and "Green" not in header_text:
+        email = "info@singaporeschoolmanila.com.ph"
+    elif "Clark" in header_text:
+        email = "admin@singaporeschoolclark.com"
+    elif "Green" in header_text:
+        email = "info@ssmgreencampus.com"
+    elif "Cebu" in header_text:
+        email = "info@singaporeschoolcebu.com"
+    else:
+        return None
+    
+    logger.info(f"Using hardcoded email for {header_text}: {email}")
+    return email
+
 class SSMScraper(BaseScraper):
     """Scraper for Singapore School Manila website"""
     
+    __slots__ = ("session_manager", "_soup_tasks")
+    
     def __init__(self):
         super().__init__()
         self.base_url = "https://singaporeschools.ph"
         self.name = "Singapore School Manila"
         self.short_name = "SSM"
-        self.session_manager = SessionManager()
+        self.session_manager = get_session_manager()
+        self._soup_tasks = {}
+    
+    async def _fetch_soup(self, url, *parse_args):
+        response = await self.session_manager.get(url)
+        return await asyncio.to_thread(_parse_page, response, *parse_args)
+    
+    async def _get_soup(self, url, *parse_args):
+        """Return the parsed page at url, fetching and parsing it on first use.
+        
+        Parsed pages are kept per scrape run, so a page read by several
+        scrape_* methods is only parsed once. The pending task is cached
+        rather than the soup, so methods running concurrently all wait on the
+        same parse instead of each starting their own. parse_args are passed
+        on to _parse_page.
+        """
+        task = self._soup_tasks.get(url)
+        if task is None:
+            task = self._soup_tasks[url] = asyncio.create_task(self._fetch_soup(url, *parse_args))
+        return await task
+    
+    async def _get_admission_soup(self):
+        """Return the parsed admission page, read by the tuition, curriculum and enrollment scrapes"""
+        return await self._get_soup(f"{self.base_url}/admission/")
     
     async def scrape_tuition_fees(self):
         """Scrape tuition fee information from SSM website"""
@@ -33,16 +305,12 @@ class SSMScraper(BaseScraper):
         try:
             url = f"{self.base_url}/tuition-and-fees"
             
-            # Use session manager to get the main tuition page
-            response = await self.session_manager.get(url)
-            
-            # Also get the admission page which contains fee information
-            admission_url = "https://singaporeschools.ph/admission/"
-            admission_response = await self.session_manager.get(admission_url)
-            
-            # Parse the HTML content
-            soup = BeautifulSoup(response.text, 'html.parser')
-            admission_soup = BeautifulSoup(admission_response.text, 'html.parser')
+            # Fetch and parse the main tuition page and the admission page
+            # (which also contains fee information) concurrently
+            soup, admission_soup = await asyncio.gather(
+                self._get_soup(url),
+                self._get_admission_soup()
+            )
             
             # Initialize data structure
             tuition_data = {
@@ -53,37 +321,38 @@ class SSMScraper(BaseScraper):
             }
             
             # First, process the admission page which has more structured fees
-            fee_section = admission_soup.select_one("div.column_attr h4:contains('Fees')")
+            fee_section = _COLUMN_FEES_HEADING_SEL.select_one(admission_soup)
             if fee_section:
                 # Find the parent container
                 fee_container = fee_section.parent
                 
                 # Extract fee items from the list
-                fee_items = fee_container.select("ul li")
+                fee_items = _FEE_ITEM_SEL.select(fee_container)
                 
                 for item in fee_items:
                     item_text = item.get_text(strip=True)
                     
                     # Parse the fee name and amount
-                    fee_match = re.search(r'(.*?):\s*(?:Php)?\s*([\d,]+(?:\.\d+)?)', item_text)
-                    if fee_match:
-                        fee_name = fee_match.group(1).strip()
-                        fee_amount = fee_match.group(2).strip()
+                    fee = _parse_fee_line(item_text)
+                    if fee:
+                        fee_name, fee_amount = fee
                         
-                        # Format and add to additional fees
-                        tuition_data["application_fees"][fee_name] = f"PHP {fee_amount}"
-                        logger.info(f"Added application fee: {fee_name}: PHP {fee_amount}")
+                        # Add to application fees
+                        tuition_data["application_fees"][fee_name] = fee_amount
+                        logger.debug("Added application fee: %s: %s", fee_name, fee_amount)
+                
+                logger.info("Extracted %d application fees", len(tuition_data["application_fees"]))
                 
                 # Look for additional notes
-                note_text = fee_container.select_one("span[style*='color:#9a0303']")
+                note_text = _FEE_NOTE_SEL.select_one(fee_container)
                 if note_text:
                     note = note_text.get_text(strip=True)
                     if note:
                         tuition_data["notes"] = note
-                        logger.info(f"Added tuition note: {note}")
+                        logger.debug("Added tuition note: %s", note)
             
             # Now process the main tuition page for program-specific tuition fees
-            content_section = soup.select_one("div.content-area, div.entry-content, main#main")
+            content_section = _CONTENT_SEL.select_one(soup)
             
             if not content_section:
                 logger.warning("Could not find main content section on tuition page")
@@ -93,7 +362,7 @@ class SSMScraper(BaseScraper):
                 return {"status": "error", "message": "Tuition content section not found"}
             
             # Look for tables containing tuition information
-            tables = content_section.select("table")
+            tables = content_section.find_all("table")
             
             if tables:
                 logger.info(f"Found {len(tables)} tables on tuition page")
@@ -101,39 +370,40 @@ class SSMScraper(BaseScraper):
                 
                 for table_idx, table in enumerate(tables):
                     # Try to determine what type of table this is from surrounding headings
-                    prev_heading = table.find_previous(["h1", "h2", "h3", "h4", "h5"])
+                    prev_heading = table.find_previous(_HEADING_TAGS)
                     
                     if prev_heading:
                         heading_text = prev_heading.get_text(strip=True).lower()
                         
-                        if any(keyword in heading_text for keyword in ["payment", "scheme"]):
+                        if any(keyword in heading_text for keyword in _PAYMENT_KEYWORDS):
                             current_program_type = "payment_schemes"
-                        elif any(keyword in heading_text for keyword in ["additional", "other", "miscellaneous"]):
+                        elif any(keyword in heading_text for keyword in _ADDITIONAL_TABLE_KEYWORDS):
                             current_program_type = "additional_fees"
                         else:
                             current_program_type = "regular_program"
                     
                     # Extract data from the table
-                    rows = table.select("tr")
+                    rows = table.find_all("tr")
                     
-                    # Check if this is a table with headers
-                    has_headers = False
-                    header_row = None
+                    # Check if this is a table with headers, reading the header
+                    # texts once per table rather than once per data row
+                    header_cells = rows[0].find_all("th") if rows else []
+                    has_headers = bool(header_cells)
+                    header_texts = [header.get_text(strip=True) for header in header_cells]
                     
-                    if rows and rows[0].select("th"):
-                        has_headers = True
-                        header_row = rows[0]
+                    if has_headers:
                         rows = rows[1:]  # Skip header row for data processing
                     
                     for row in rows:
-                        cells = row.select("td")
+                        # Extract each cell's text once per row
+                        cell_texts = [cell.get_text(strip=True) for cell in row.find_all("td")]
                         
-                        if not cells or len(cells) < 2:
+                        if len(cell_texts) < 2:
                             continue
                         
                         if current_program_type == "regular_program":
                             # First cell typically contains program/grade level
-                            program_name = cells[0].get_text(strip=True)
+                            program_name = cell_texts[0]
                             
                             if not program_name:
                                 continue
@@ -143,37 +413,34 @@ class SSMScraper(BaseScraper):
                             
                             # If we have headers, use them as keys
                             if has_headers:
-                                headers = header_row.select("th")
-                                for i in range(1, min(len(cells), len(headers))):
-                                    header_text = headers[i].get_text(strip=True)
+                                for i in range(1, min(len(cell_texts), len(header_texts))):
+                                    header_text = header_texts[i]
                                     if header_text:
-                                        fee_info[header_text] = cells[i].get_text(strip=True)
+                                        fee_info[header_text] = cell_texts[i]
                             else:
                                 # No headers, use generic keys
-                                if len(cells) >= 2:
-                                    fee_info["Tuition Fee"] = cells[1].get_text(strip=True)
+                                fee_info["Tuition Fee"] = cell_texts[1]
                                 
-                                if len(cells) >= 3:
-                                    fee_info["Miscellaneous Fee"] = cells[2].get_text(strip=True)
+                                if len(cell_texts) >= 3:
+                                    fee_info["Miscellaneous Fee"] = cell_texts[2]
                                     
-                                if len(cells) >= 4:
-                                    fee_info["Total"] = cells[3].get_text(strip=True)
+                                if len(cell_texts) >= 4:
+                                    fee_info["Total"] = cell_texts[3]
                             
                             tuition_data["regular_program"][program_name] = fee_info
-                            logger.info(f"Added program: {program_name} with fees: {fee_info}")
+                            logger.debug("Added program: %s with fees: %s", program_name, fee_info)
                         
                         elif current_program_type == "additional_fees":
                             # Additional fees format might be different
-                            fee_name = cells[0].get_text(strip=True)
-                            fee_amount = cells[1].get_text(strip=True) if len(cells) > 1 else ""
+                            fee_name, fee_amount = cell_texts[0], cell_texts[1]
                             
                             if fee_name and fee_amount:
                                 tuition_data["additional_fees"][fee_name] = fee_amount
-                                logger.info(f"Added additional fee: {fee_name}: {fee_amount}")
+                                logger.debug("Added additional fee: %s: %s", fee_name, fee_amount)
                         
                         elif current_program_type == "payment_schemes":
                             # Payment schemes might list different payment plans
-                            scheme_name = cells[0].get_text(strip=True)
+                            scheme_name = cell_texts[0]
                             
                             if not scheme_name:
                                 continue
@@ -183,90 +450,104 @@ class SSMScraper(BaseScraper):
                             
                             # If we have headers, use them as keys
                             if has_headers:
-                                headers = header_row.select("th")
-                                for i in range(1, min(len(cells), len(headers))):
-                                    header_text = headers[i].get_text(strip=True)
+                                for i in range(1, min(len(cell_texts), len(header_texts))):
+                                    header_text = header_texts[i]
                                     if header_text:
-                                        scheme_details[header_text] = cells[i].get_text(strip=True)
+                                        scheme_details[header_text] = cell_texts[i]
                             else:
                                 # No headers, just collect all the values
-                                for i in range(1, len(cells)):
-                                    scheme_details[f"Detail {i}"] = cells[i].get_text(strip=True)
+                                for i in range(1, len(cell_texts)):
+                                    scheme_details[f"Detail {i}"] = cell_texts[i]
                             
                             tuition_data["payment_schemes"][scheme_name] = scheme_details
-                            logger.info(f"Added payment scheme: {scheme_name}")
+                            logger.debug("Added payment scheme: %s", scheme_name)
+                    
+                    logger.info("Parsed %d rows from table %d as %s", len(rows), table_idx, current_program_type)
+            elif not _FEE_RE.search(content_section.get_text()):
+                # One regex scan over the whole section text finds every amount
+                # the per-paragraph and per-item matching below could, so when
+                # it comes up empty there is nothing for the DOM walk to extract
+                logger.info("No tables or fee amounts found in text content")
             else:
                 # If no tables found, try to extract tuition info from headings and paragraphs
                 logger.info("No tables found, looking for fees in text content")
                 
                 # Look for fee sections with headings
-                fee_headings = content_section.select("h1, h2, h3, h4, h5")
+                fee_headings = content_section.find_all(_HEADING_TAGS)
                 
                 for heading in fee_headings:
                     heading_text = heading.get_text(strip=True)
+                    heading_lower = heading_text.lower()
                     
                     # Skip if not a fee-related heading
-                    if not any(keyword in heading_text.lower() for keyword in ["fee", "tuition", "cost"]):
+                    if not any(keyword in heading_lower for keyword in _FEE_HEADING_KEYWORDS):
                         continue
                     
-                    logger.info(f"Found fee heading: {heading_text}")
+                    logger.debug("Found fee heading: %s", heading_text)
+                    
+                    # The heading decides the fee type for everything under it
+                    is_additional = any(keyword in heading_lower for keyword in _ADDITIONAL_KEYWORDS)
                     
-                    # Look for fee amounts in paragraphs following this heading
+                    # Look for fee amounts in paragraphs following this heading,
+                    # walking the document lazily until the next heading. Only
+                    # text with a "name: amount" colon can match _FEE_RE
                     fee_paragraphs = []
-                    next_element = heading.find_next()
                     
-                    while next_element and next_element.name not in ["h1", "h2", "h3", "h4", "h5"]:
+                    for next_element in heading.next_elements:
+                        if next_element.name in _HEADING_TAGS:
+                            break
                         if next_element.name == "p" or next_element.name == "li":
                             fee_text = next_element.get_text(strip=True)
-                            if fee_text:
+                            if ":" in fee_text:
                                 fee_paragraphs.append(fee_text)
-                        next_element = next_element.find_next()
                     
                     # Process the fee paragraphs to extract amounts
                     for p_text in fee_paragraphs:
                         # Try to find program and amount
-                        fee_match = re.search(r'(.*?):\s*(?:PHP|Php)?\s*([\d,]+(?:\.\d+)?)', p_text)
+                        fee = _parse_fee_line(p_text)
                         
-                        if fee_match:
-                            fee_name = fee_match.group(1).strip()
-                            fee_amount = f"PHP {fee_match.group(2).strip()}"
+                        if fee:
+                            fee_name, fee_amount = fee
                             
                             # Determine the fee type
-                            if any(keyword in heading_text.lower() for keyword in ["additional", "other", "misc"]):
+                            if is_additional:
                                 tuition_data["additional_fees"][fee_name] = fee_amount
-                                logger.info(f"Added additional fee from text: {fee_name}: {fee_amount}")
+                                logger.debug("Added additional fee from text: %s: %s", fee_name, fee_amount)
                             else:
                                 program_name = fee_name
                                 tuition_data["regular_program"][program_name] = {"Tuition Fee": fee_amount}
-                                logger.info(f"Added regular program fee from text: {program_name}: {fee_amount}")
+                                logger.debug("Added regular program fee from text: %s: %s", program_name, fee_amount)
                 
-                # Look for lists that might contain fee information
-                fee_lists = content_section.select("ul, ol")
-                
-                for fee_list in fee_lists:
-                    list_items = fee_list.select("li")
+                # Look for list items that might contain fee information. One
+                # pass over every <li> also avoids visiting nested lists twice
+                for item in content_section.find_all("li"):
+                    item_text = item.get_text(strip=True)
                     
-                    for item in list_items:
-                        item_text = item.get_text(strip=True)
-                        
-                        # Try to match fee patterns
-                        fee_match = re.search(r'(.*?):\s*(?:PHP|Php)?\s*([\d,]+(?:\.\d+)?)', item_text)
+                    # Try to match fee patterns
+                    fee = _parse_fee_line(item_text)
+                    
+                    if fee:
+                        fee_name, fee_amount = fee
                         
-                        if fee_match:
-                            fee_name = fee_match.group(1).strip()
-                            fee_amount = f"PHP {fee_match.group(2).strip()}"
-                            
-                            # Check for keywords to determine fee type
-                            if any(keyword in fee_name.lower() for keyword in ["application", "entrance", "admission"]):
-                                tuition_data["application_fees"][fee_name] = fee_amount
-                                logger.info(f"Added application fee from list: {fee_name}: {fee_amount}")
-                            elif any(keyword in fee_name.lower() for keyword in ["additional", "other", "misc"]):
-                                tuition_data["additional_fees"][fee_name] = fee_amount
-                                logger.info(f"Added additional fee from list: {fee_name}: {fee_amount}")
-                            else:
-                                # Assume it's a program fee
-                                tuition_data["additional_fees"][fee_name] = fee_amount
-                                logger.info(f"Added fee from list: {fee_name}: {fee_amount}")
+                        # Check for keywords to determine fee type
+                        fee_name_lower = fee_name.lower()
+                        if any(keyword in fee_name_lower for keyword in _APPLICATION_KEYWORDS):
+                            tuition_data["application_fees"][fee_name] = fee_amount
+                            logger.debug("Added application fee from list: %s: %s", fee_name, fee_amount)
+                        elif any(keyword in fee_name_lower for keyword in _ADDITIONAL_KEYWORDS):
+                            tuition_data["additional_fees"][fee_name] = fee_amount
+                            logger.debug("Added additional fee from list: %s: %s", fee_name, fee_amount)
+                        else:
+                            # Assume it's a program fee
+                            tuition_data["additional_fees"][fee_name] = fee_amount
+                            logger.debug("Added fee from list: %s: %s", fee_name, fee_amount)
+                
+                logger.info(
+                    "Extracted %d program, %d additional and %d application fees from text",
+                    len(tuition_data["regular_program"]),
+                    len(tuition_data["additional_fees"]),
+                    len(tuition_data["application_fees"]),
+                )
             
             # Check if we were able to extract any fee information
             if not tuition_data["regular_program"] and not tuition_data["additional_fees"] and not tuition_data["payment_schemes"] and not tuition_data["application_fees"]:
@@ -296,13 +577,7 @@ class SSMScraper(BaseScraper):
         
         try:
             # Use primary admission page which has curriculum information
-            url = "https://singaporeschools.ph/admission/"
-            
-            # Use session manager
-            response = await self.session_manager.get(url)
-            
-            # Parse the HTML content
-            soup = BeautifulSoup(response.text, 'html.parser')
+            soup = await self._get_admission_soup()
             
             # Initialize curriculum data structure
             curriculum_data = {
@@ -312,12 +587,12 @@ class SSMScraper(BaseScraper):
             }
             
             # Look for the table with level and age information
-            tables = soup.select("table")
+            tables = soup.find_all("table")
             level_table = None
             
             for table in tables:
                 # Check if this table contains the expected curriculum headers
-                headers = table.select("thead th")
+                headers = _LEVEL_HEADER_SEL.select(table)
                 if len(headers) >= 2:
                     header_texts = [header.get_text(strip=True).lower() for header in headers]
                     if "level" in header_texts[0] and "age" in header_texts[1]:
@@ -328,18 +603,10 @@ class SSMScraper(BaseScraper):
                 logger.info("Found curriculum level table")
                 
                 # Get all rows from the table body
-                rows = level_table.select("tbody tr")
+                rows = _LEVEL_ROW_SEL.select(level_table)
                 
-                # Group programs by education level
-                education_levels = {
-                    "preschool": ["Nursery", "Kinder 1", "Kinder 2"],
-                    "primary": ["Primary 1", "Primary 2", "Primary 3", "Primary 4", "Primary 5", "Primary 6"],
-                    "secondary": ["Secondary 1", "Secondary 2", "Secondary 3", "Secondary 4"],
-                    "pre_university": ["Cambridge AS/A and IBDP"]
-                }
-                
-                # Create the curriculum structure with these categories
-                for category in education_levels:
+                # Create the curriculum structure with the education level categories
+                for category in _EDUCATION_LEVELS:
                     curriculum_data["programs"][category] = {
                         "levels": [],
                         "description": f"{category.replace('_', ' ').title()} Education"
@@ -347,17 +614,13 @@ class SSMScraper(BaseScraper):
                 
                 # Process each row in the table
                 for row in rows:
-                    cells = row.select("td")
+                    cells = row.find_all("td")
                     if len(cells) >= 2:
                         level_name = cells[0].get_text(strip=True)
                         age_requirement = cells[1].get_text(strip=True)
                         
                         # Determine which education level this belongs to
-                        assigned_category = None
-                        for category, levels in education_levels.items():
-                            if level_name in levels:
-                                assigned_category = category
-                                break
+                        assigned_category = _LEVEL_TO_CATEGORY.get(level_name)
                         
                         if assigned_category:
                             # Add this level to the appropriate category
@@ -365,7 +628,7 @@ class SSMScraper(BaseScraper):
                                 "name": level_name,
                                 "age_requirement": age_requirement
                             })
-                            logger.info(f"Added level {level_name} to {assigned_category} with age requirement: {age_requirement}")
+                            logger.debug("Added level %s to %s with age requirement: %s", level_name, assigned_category, age_requirement)
                         else:
                             # If we can't categorize it, add it to a special category
                             if "other" not in curriculum_data["programs"]:
@@ -377,32 +640,37 @@ class SSMScraper(BaseScraper):
                                 "name": level_name,
                                 "age_requirement": age_requirement
                             })
-                            logger.info(f"Added level {level_name} to other category with age requirement: {age_requirement}")
+                            logger.debug("Added level %s to other category with age requirement: %s", level_name, age_requirement)
+                
+                logger.info("Processed %d curriculum level rows", len(rows))
             
             # Look for curriculum overview or approach information
-            intro_sections = soup.select("div.mcb-column-inner div.column_attr")
+            intro_sections = _INTRO_SEL.select(soup)
             curriculum_info_found = False
+            approach_parts = []
+            overview_parts = []
             
             for section in intro_sections:
                 section_text = section.get_text(strip=True)
                 
                 # Check if this section contains curriculum-related keywords
-                if any(keyword in section_text.lower() for keyword in ["curriculum", "education", "program", "approach", "methodology"]):
+                if any(keyword in section_text.lower() for keyword in _CURRICULUM_SECTION_KEYWORDS):
                     # This might be a curriculum description
-                    paragraphs = section.select("p")
+                    paragraphs = section.find_all("p")
                     
                     for p in paragraphs:
                         p_text = p.get_text(strip=True)
-                        if any(keyword in p_text.lower() for keyword in ["curriculum", "methodology"]):
-                            curriculum_data["curriculum_approach"] += p_text + " "
+                        p_lower = p_text.lower()
+                        if any(keyword in p_lower for keyword in _CURRICULUM_APPROACH_KEYWORDS):
+                            approach_parts.append(p_text)
                             curriculum_info_found = True
-                        elif any(keyword in p_text.lower() for keyword in ["education", "program", "school"]) and not curriculum_data["overview"]:
-                            curriculum_data["overview"] += p_text + " "
+                        elif any(keyword in p_lower for keyword in _CURRICULUM_OVERVIEW_KEYWORDS) and not overview_parts:
+                            overview_parts.append(p_text)
                             curriculum_info_found = True
             
-            # Clean up the text fields
-            curriculum_data["curriculum_approach"] = curriculum_data["curriculum_approach"].strip()
-            curriculum_data["overview"] = curriculum_data["overview"].strip()
+            # Join the collected text fields
+            curriculum_data["curriculum_approach"] = " ".join(approach_parts)
+            curriculum_data["overview"] = " ".join(overview_parts)
             
             # Add information about special programs
             if "pre_university" in curriculum_data["programs"]:
@@ -434,13 +702,7 @@ class SSMScraper(BaseScraper):
         
         try:
             # Use the admission page which contains enrollment process information
-            url = "https://singaporeschools.ph/admission/"
-            
-            # Use session manager
-            response = await self.session_manager.get(url)
-            
-            # Parse the HTML content
-            soup = BeautifulSoup(response.text, 'html.parser')
+            soup = await self._get_admission_soup()
             
             # Initialize enrollment data structure
             enrollment_data = {
@@ -450,59 +712,58 @@ class SSMScraper(BaseScraper):
                 "fees": {}
             }
             
+            # Requirements already added, for constant-time duplicate checks
+            seen_requirements = set()
+            
             # Find the main content section with the enrollment steps
             # This specific HTML structure has a section element containing all the steps
-            main_section = soup.select_one("section.section")
+            main_section = soup.find("section", class_="section")
             
             if main_section:
                 logger.info("Found main section container")
                 
                 # Find all step headers using the specific pattern
-                step_headers = main_section.select("h3 span[style*='color:#283771']")
+                step_headers = _STEP_HEADER_SEL.select(main_section)
                 logger.info(f"Found {len(step_headers)} step headers")
                 
                 # Process each step found
                 for header in step_headers:
                     # Extract step number from text (e.g., "STEP 1" -> "1")
                     step_text = header.get_text(strip=True)
-                    step_number = re.search(r'STEP\s+(\d+)', step_text)
+                    step_number = _STEP_RE.search(step_text)
                     
                     if not step_number:
                         continue
                         
                     step_num = step_number.group(1)
-                    logger.info(f"Processing {step_text}")
+                    logger.debug("Processing %s", step_text)
                     
                     # Find the container for this step by going up to the mcb-wrap level
-                    step_container = header
-                    while step_container and not ('mcb-wrap' in step_container.get('class', [])):
-                        step_container = step_container.parent
+                    step_container = header.find_parent(class_="mcb-wrap")
                     
                     if not step_container:
                         logger.warning(f"Could not find container for {step_text}")
                         continue
                     
                     # Find the description paragraph(s) - typically in a column_attr div
-                    description_elements = step_container.select("div.column_attr p")
-                    step_description = ""
-                    
-                    for desc_elem in description_elements:
-                        step_description += desc_elem.get_text(strip=True) + " "
-                    
-                    step_description = step_description.strip()
+                    description_elements = _STEP_DESCRIPTION_SEL.select(step_container)
+                    step_description = " ".join(
+                        desc_elem.get_text(strip=True) for desc_elem in description_elements
+                    ).strip()
                     
                     # Find any lists in this step (requirements, etc.)
                     step_requirements = []
                     if step_num == "1":  # Step 1 has the requirements list
-                        req_list = step_container.select_one("ol, ul")
+                        req_list = step_container.find(["ol", "ul"])
                         if req_list:
-                            req_items = req_list.select("li")
+                            req_items = req_list.find_all("li")
                             for item in req_items:
                                 req_text = item.get_text(strip=True)
                                 if req_text:
                                     step_requirements.append(req_text)
                                     # Also add to the main requirements list
-                                    if req_text not in enrollment_data["requirements"]:
+                                    if req_text not in seen_requirements:
+                                        seen_requirements.add(req_text)
                                         enrollment_data["requirements"].append(req_text)
                     
                     # Create a structured step object
@@ -515,13 +776,15 @@ class SSMScraper(BaseScraper):
                     
                     # Add step data to the enrollment process
                     enrollment_data["steps"].append(step_data)
-                    logger.info(f"Added step {step_num} with description: {step_description[:50]}...")
+                    logger.debug("Added step %s with description: %s...", step_num, step_description[:50])
+                
+                logger.info("Extracted %d enrollment steps", len(enrollment_data["steps"]))
                 
                 # Look for fees information - usually in the last step (STEP 4)
-                fees_heading = main_section.select_one("h4:contains('Fees')")
+                fees_heading = _FEES_HEADING_SEL.select_one(main_section)
                 
                 if not fees_heading:  # Try with a more general selector
-                    fees_heading = main_section.select_one("h4")
+                    fees_heading = main_section.find("h4")
                     if fees_heading and "Fees" not in fees_heading.get_text(strip=True):
                         fees_heading = None
                 
@@ -531,78 +794,79 @@ class SSMScraper(BaseScraper):
                     fees_container = fees_heading.parent
                     
                     # Extract fees from list
-                    fees_list = fees_container.select_one("ul, ol")
+                    fees_list = fees_container.find(["ul", "ol"])
                     if fees_list:
-                        fee_items = fees_list.select("li")
+                        fee_items = fees_list.find_all("li")
                         
                         for item in fee_items:
                             fee_text = item.get_text(strip=True)
                             
                             # Use regex to extract fee name and amount
-                            fee_match = re.search(r'(.*?):\s*(?:Php)?\s*([\d,]+(?:\.\d+)?)', fee_text)
-                            if fee_match:
-                                fee_name = fee_match.group(1).strip()
-                                fee_amount = f"PHP {fee_match.group(2).strip()}"
+                            fee = _parse_fee_line(fee_text)
+                            if fee:
+                                fee_name, fee_amount = fee
                                 
                                 # Add to fees dictionary
                                 enrollment_data["fees"][fee_name] = fee_amount
-                                logger.info(f"Added fee: {fee_name}: {fee_amount}")
+                                logger.debug("Added fee: %s: %s", fee_name, fee_amount)
+                        
+                        logger.info("Extracted %d enrollment fees", len(enrollment_data["fees"]))
                     
                     # Look for notes about the fees
-                    notes_span = fees_container.select_one("span[style*='color:#9a0303']")
+                    notes_span = _FEE_NOTE_SEL.select_one(fees_container)
                     if notes_span:
                         note_text = notes_span.get_text(strip=True)
                         if note_text:
                             enrollment_data["fee_notes"] = note_text
-                            logger.info(f"Added fee notes: {note_text}")
+                            logger.debug("Added fee notes: %s", note_text)
             
             # If we couldn't find the main section, try a more general approach
             if not enrollment_data["steps"]:
                 logger.info("Main section not found, trying alternative approach")
                 
                 # Try to find step headers throughout the document
-                step_spans = soup.select("span[style*='color:#283771']")
+                step_spans = _STEP_SPAN_SEL.select(soup)
                 
                 for span in step_spans:
                     span_text = span.get_text(strip=True)
                     if "STEP" in span_text:
-                        logger.info(f"Found step header: {span_text}")
+                        logger.debug("Found step header: %s", span_text)
                         
                         # Get step number
-                        step_match = re.search(r'STEP\s+(\d+)', span_text)
+                        step_match = _STEP_RE.search(span_text)
                         if not step_match:
                             continue
                             
                         step_num = step_match.group(1)
                         
                         # Try to find the related description by looking at parent elements
-                        parent = span.parent
-                        while parent and parent.name != 'div':
-                            parent = parent.parent
+                        parent = span.find_parent('div')
                         
                         # Once we reach a div, look for neighboring divs that might contain the description
-                        if parent and parent.name == 'div':
+                        if parent:
                             # Find the main container that holds both the header and description
-                            main_container = parent
-                            while main_container and not ('mcb-wrap' in main_container.get('class', [])):
-                                main_container = main_container.parent
+                            if 'mcb-wrap' in parent.get('class', []):
+                                main_container = parent
+                            else:
+                                main_container = parent.find_parent(class_="mcb-wrap")
                             
                             if main_container:
                                 # Look for paragraph in the same container
-                                desc_p = main_container.select_one("p")
+                                desc_p = main_container.find("p")
                                 step_description = desc_p.get_text(strip=True) if desc_p else ""
                                 
                                 # Look for requirements list in the same container
                                 step_requirements = []
-                                req_list = main_container.select_one("ol, ul")
+                                req_list = main_container.find(["ol", "ul"])
                                 if req_list:
-                                    req_items = req_list.select("li")
+                                    req_items = req_list.find_all("li")
                                     for item in req_items:
                                         req_text = item.get_text(strip=True)
                                         if req_text:
                                             step_requirements.append(req_text)
                                             # Also add to the main requirements list
-                                            if step_num == "1" and req_text not in enrollment_data["requirements"]:
+                                            if step_num == "1" and req_text not in seen_requirements:
+                                                seen_requirements.add(req_text)
                                                 enrollment_data["requirements"].append(req_text)
                                 
                                 # Create a structured step object
@@ -615,95 +879,46 @@ class SSMScraper(BaseScraper):
                                 
                                 # Add step data to the enrollment process
                                 enrollment_data["steps"].append(step_data)
-                                logger.info(f"Added step {step_num} using alternative method")
+                                logger.debug("Added step %s using alternative method", step_num)
                 
                 # Also try to find fees information using a more general approach
                 if not enrollment_data["fees"]:
-                    fees_heading = soup.select_one("h4")
+                    fees_heading = soup.find("h4")
                     
                     if fees_heading and "Fees" in fees_heading.get_text(strip=True):
                         fees_container = fees_heading.parent
                         
                         # Extract fees from list
-                        fees_list = fees_container.select_one("ul, ol")
+                        fees_list = fees_container.find(["ul", "ol"])
                         if fees_list:
-                            fee_items = fees_list.select("li")
+                            fee_items = fees_list.find_all("li")
                             
                             for item in fee_items:
                                 fee_text = item.get_text(strip=True)
                                 
                                 # Use regex to extract fee name and amount
-                                fee_match = re.search(r'(.*?):\s*(?:Php)?\s*([\d,]+(?:\.\d+)?)', fee_text)
-                                if fee_match:
-                                    fee_name = fee_match.group(1).strip()
-                                    fee_amount = f"PHP {fee_match.group(2).strip()}"
+                                fee = _parse_fee_line(fee_text)
+                                if fee:
+                                    fee_name, fee_amount = fee
                                     
                                     # Add to fees dictionary
                                     enrollment_data["fees"][fee_name] = fee_amount
-                                    logger.info(f"Added fee: {fee_name}: {fee_amount}")
+                                    logger.debug("Added fee: %s: %s", fee_name, fee_amount)
                         
                         # Look for notes about the fees
-                        notes_span = fees_container.select_one("span[style*='color:#9a0303']")
+                        notes_span = _FEE_NOTE_SEL.select_one(fees_container)
                         if notes_span:
                             note_text = notes_span.get_text(strip=True)
                             if note_text:
                                 enrollment_data["fee_notes"] = note_text
-                                logger.info(f"Added fee notes: {note_text}")
+                                logger.debug("Added fee notes: %s", note_text)
             
             # Deal with a very specific case for this website - direct HTML parsing
             if not enrollment_data["steps"]:
                 logger.info("Trying direct HTML structure parsing")
                 
-                # Create direct steps from the HTML structure we know
-                steps_data = [
-                    {
-                        "step_number": "STEP 1",
-                        "title": "Step 1",
-                        "description": "Parents/ Guardians of applicants must submit the following:",
-                        "requirements": [
-                            "Copy of latest report card for incoming K to Secondary 4 students",
-                            "Transcript of records (TOR) for incoming Pre-University students",
-                            "1 x 1 photo (coloured, 3 pcs.)",
-                            "Accomplished application form",
-                            "Birth certificate",
-                            "Copy of passport, ACR I-Card and visa of child and parents (for foreign students)",
-                            "Non-refundable processing fee of Php 6,000.00",
-                            "Letter of recommendation from previous school (downloadable)"
-                        ]
-                    },
-                    {
-                        "step_number": "STEP 2",
-                        "title": "Step 2",
-                        "description": "Upon submission of all requirements, the child will be given a schedule for admission test and interview. Please come on your scheduled time and date.",
-                        "requirements": []
-                    },
-                    {
-                        "step_number": "STEP 3",
-                        "title": "Step 3",
-                        "description": "The parents or guardians will be given a schedule for INTERVIEW with the School Administrator and/or Managing Director. * Results will be sent to you within two weeks by mail and by phone. Upon acceptance, the complete Transcript of Records (TOR) must be submitted before enrolment.",
-                        "requirements": []
-                    },
-                    {
-                        "step_number": "STEP 4",
-                        "title": "Step 4",
-                        "description": "Upon acceptance, SCHOOL DEVELOPMENT FEE and RESERVATION FEE must be settled.",
-                        "requirements": []
-                    }
-                ]
-                
-                enrollment_data["steps"] = steps_data
-                enrollment_data["requirements"] = steps_data[0]["requirements"]
-                
-                # Add fees information
-                fees = {
-                    "Application and Testing Fee": "PHP 6,000.00",
-                    "School Development Fee (one time, no refund)": "PHP 125,000.00",
-                    "Slot Reservation Fee (will be deducted from tuition upon enrolment)": "PHP 50,000.00",
-                    "School Deposit (one time payment; to be refunded without interest when the student graduates or withdraws)": "PHP 50,000.00"
-                }
-                
-                enrollment_data["fees"] = fees
-                enrollment_data["fee_notes"] = "Tuition, materials and tests fees are available upon request. ***Important note: SSM, SSCL and SSMGC have a NO REFUND POLICY."
+                # Create direct steps and fees from the HTML structure we know
+                enrollment_data = _fallback_enrollment_data()
                 
                 logger.info("Added enrollment steps and fees using direct HTML structure knowledge")
             
@@ -717,7 +932,7 @@ class SSMScraper(BaseScraper):
                 }
             
             # Create a more organized summary of the enrollment process
-            enrollment_data["overview"] = "The admission process for Singapore School Manila consists of document submission, entrance testing, parent interview, and payment of required fees upon acceptance."
+            enrollment_data["overview"] = _ENROLLMENT_OVERVIEW
             
             return {
                 "status": "success",
@@ -735,10 +950,7 @@ class SSMScraper(BaseScraper):
         """Scrape scholarship information from SSM website"""
         logger.info(f"Scraping scholarship information for {self.name}")
         
-        return {
-            "status": "skipped",
-            "message": "Scholarship information scraping is skipped for this school because it is not available on the website.",
-        }
+        return dict(_SCHOLARSHIP_SKIPPED)
     
     async def scrape_contact_info(self):
         """Scrape essential contact information from SSM website"""
@@ -748,25 +960,22 @@ class SSMScraper(BaseScraper):
             # Use the contact page which contains contact information
             url = "https://singaporeschools.ph/contact-us/"
             
-            # Use session manager
-            response = await self.session_manager.get(url)
-            
-            # Parse the HTML content
-            soup = BeautifulSoup(response.text, 'html.parser')
+            # Fetch and parse the HTML content. The location names are <p>
+            # elements nested in <b>, which lxml's HTML4 parser hoists out of
+            # the <b>, so this page keeps html.parser to preserve the "b p" structure
+            soup = await self._get_soup(url, 'html.parser', _CONTACT_SECTIONS_ONLY)
             
             # Initialize array to store all school locations
             locations = []
             
             # Find all Singapore School locations sections
-            school_headers = soup.select("div.column_attr b p, div.column_attr span b p")
+            school_headers = soup.find_all(_is_location_header)
             
             for header in school_headers:
                 header_text = header.get_text(strip=True)
                 if "Singapore School" in header_text:
                     # Go up to the wrapper container that holds the entire school section
-                    section = header
-                    while section and not (section.name == "div" and "mcb-wrap" in section.get('class', [])):
-                        section = section.parent
+                    section = header.find_parent("div", class_="mcb-wrap")
                     
                     if section:
                         logger.info(f"Found school section: {header_text}")
@@ -779,74 +988,48 @@ class SSMScraper(BaseScraper):
                             "contact_person": "N/A"
                         }
                         
-                        # Try multiple approaches to extract email
-                        # 1. Find all paragraphs with label "Email Us" and then get the next sibling or child
-                        email_labels = section.select("p:contains('Email Us'), p b:contains('Email Us'), p strong:contains('Email Us'), span b p:contains('Email Us'), span:contains('Email Us')")
+                        # Walk the section's text tags once, sorting them (in document
+                        # order) into the labels and candidates used below. Every
+                        # label and candidate is one of these tags, so other elements
+                        # never have their text extracted
+                        email_labels = []
+                        phone_labels = []
+                        plus_paragraphs = []
+                        contact_labels = []
                         
-                        for label in email_labels:
-                            logger.info(f"Found email label in {header_text}")
+                        for elem in section.find_all(_CONTACT_TEXT_TAGS):
+                            elem_text = elem.get_text()
                             
-                            # First, try getting the next paragraph
-                            next_p = label.find_next("p")
-                            if next_p:
-                                email_text = next_p.get_text(strip=True)
-                                if "@" in email_text:
-                                    location_data["email"] = email_text
-                                    logger.info(f"Found email from next paragraph: {email_text}")
-                                    break
+                            # Label elements are p and span tags, or b/strong inside a p
+                            if elem.name in ("p", "span") or elem.find_parent("p"):
+                                if "Email Us" in elem_text:
+                                    email_labels.append(elem)
+                                if "Call Us" in elem_text:
+                                    phone_labels.append(elem)
                             
-                            # If that fails, look for span elements containing @ within the parent
-                            parent_container = label.parent.parent if label.parent else label.parent
-                            if parent_container:
-                                email_spans = parent_container.select("span:contains('@'), p:contains('@')")
-                                for span in email_spans:
-                                    email_text = span.get_text(strip=True)
-                                    if "@" in email_text:
-                                        location_data["email"] = email_text
-                                        logger.info(f"Found email from span: {email_text}")
-                                        break
-                        
-                        # 2. Direct approach - find all elements containing @ symbol in this section
-                        if location_data["email"] == "N/A":
-                            email_elements = section.select("*:contains('@')")
-                            for elem in email_elements:
-                                email_text = elem.get_text(strip=True)
-                                if "@" in email_text and "example" not in email_text.lower():
-                                    # Extract just the email part if the text contains other content
-                                    email_match = re.search(r'[\w\.-]+@[\w\.-]+\.\w+', email_text)
-                                    if email_match:
-                                        location_data["email"] = email_match.group(0)
-                                        logger.info(f"Found email using regex: {location_data['email']}")
-                                        break
-                                    else:
-                                        location_data["email"] = email_text
-                                        logger.info(f"Found email using direct search: {email_text}")
-                                        break
+                            if elem.name == "p":
+                                if "+" in elem_text:
+                                    plus_paragraphs.append(elem)
+                                if any(keyword in elem_text for keyword in _CONTACT_PERSON_KEYWORDS):
+                                    contact_labels.append(elem)
                         
-                        # 3. Hardcoded values as a last resort
-                        if location_data["email"] == "N/A":
-                            if "Manila" in header_text and "Green" not in header_text:
-                                location_data["email"] = "info@singaporeschoolmanila.com.ph"
-                            elif "Clark" in header_text:
-                                location_data["email"] = "admin@singaporeschoolclark.com"
-                            elif "Green" in header_text:
-                                location_data["email"] = "info@ssmgreencampus.com"
-                            elif "Cebu" in header_text:
-                                location_data["email"] = "info@singaporeschoolcebu.com"
-                            
-                            if location_data["email"] != "N/A":
-                                logger.info(f"Using hardcoded email for {header_text}: {location_data['email']}")
+                        # Try each email source in turn, stopping at the first hit:
+                        # labelled email, any address in the section, known campus email
+                        location_data["email"] = (
+                            _email_from_labels(email_labels, header_text)
+                            or _email_from_text(section)
+                            or _known_campus_email(header_text)
+                            or "N/A"
+                        )
                         
                         # Extract phone number
                         # Similar approach for phone numbers - try multiple methods
-                        phone_labels = section.select("p:contains('Call Us'), p b:contains('Call Us'), p strong:contains('Call Us'), span b p:contains('Call Us'), span:contains('Call Us')")
-                        
                         for label in phone_labels:
                             # First, try getting the next paragraph
                             next_p = label.find_next("p")
                             if next_p:
                                 phone_text = next_p.get_text(strip=True)
-                                if any(char.isdigit() for char in phone_text):
+                                if _HAS_DIGIT.search(phone_text):
                                     location_data["phone"] = phone_text
                                     logger.info(f"Found phone from next paragraph: {phone_text}")
                                     break
@@ -854,10 +1037,10 @@ class SSMScraper(BaseScraper):
                             # If that fails, look for spans containing digits within the parent
                             parent_container = label.parent.parent if label.parent else label.parent
                             if parent_container:
-                                phone_elements = parent_container.select("span, p")
+                                phone_elements = _TEXT_BLOCK_SEL.select(parent_container)
                                 for elem in phone_elements:
                                     phone_text = elem.get_text(strip=True)
-                                    if any(char.isdigit() for char in phone_text) and "Call Us" not in phone_text:
+                                    if _HAS_DIGIT.search(phone_text) and "Call Us" not in phone_text:
                                         location_data["phone"] = phone_text
                                         logger.info(f"Found phone from container: {phone_text}")
                                         break
@@ -865,21 +1048,19 @@ class SSMScraper(BaseScraper):
                         # Fallback for phone numbers
                         if location_data["phone"] == "N/A":
                             # Try direct approach - find elements with + or digits
-                            phone_elements = section.select("p:contains('+')")
-                            for elem in phone_elements:
+                            for elem in plus_paragraphs:
                                 phone_text = elem.get_text(strip=True)
-                                if "+" in phone_text and any(char.isdigit() for char in phone_text):
+                                if "+" in phone_text and _HAS_DIGIT.search(phone_text):
                                     location_data["phone"] = phone_text
                                     logger.info(f"Found phone using direct search: {phone_text}")
                                     break
                         
                         # Look for possible contact person (this is less likely to be in the HTML)
-                        contact_labels = section.select("p:contains('Contact Person'), p:contains('Administrator'), p:contains('Principal'), p:contains('Director')")
                         for label in contact_labels:
                             next_p = label.find_next("p")
                             if next_p and next_p.get_text(strip=True):
                                 person = next_p.get_text(strip=True)
-                                if person and not any(keyword in person.lower() for keyword in ["email", "call", "phone", "visit"]):
+                                if person and not _PERSON_REJECT.search(person):
                                     location_data["contact_person"] = person
                                     logger.info(f"Found contact person: {person}")
                                     break
@@ -892,32 +1073,7 @@ class SSMScraper(BaseScraper):
                 logger.warning("No school locations found, using fallback method")
                 
                 # Add default entries for all four schools
-                locations = [
-                    {
-                        "name": "Singapore School Manila",
-                        "email": "info@singaporeschoolmanila.com.ph",
-                        "phone": "+632 79669315 / +632 75004672 / +632 75053952",
-                        "contact_person": "N/A"
-                    },
-                    {
-                        "name": "Singapore School Clark",
-                        "email": "admin@singaporeschoolclark.com",
-                        "phone": "+45 4998287 / +63908 8853848",
-                        "contact_person": "N/A"
-                    },
-                    {
-                        "name": "Singapore School Manila Green Campus",
-                        "email": "info@ssmgreencampus.com",
-                        "phone": "+63917 5471717 / +46 4096200",
-                        "contact_person": "N/A"
-                    },
-                    {
-                        "name": "Singapore School Cebu",
-                        "email": "info@singaporeschoolcebu.com",
-                        "phone": "+6332 2356772 / +63917 8333772",
-                        "contact_person": "N/A"
-                    }
-                ]
+                locations = [dict(location) for location in _FALLBACK_LOCATIONS]
             
             # Return the array of location contact information
             return {
@@ -940,17 +1096,31 @@ class SSMScraper(BaseScraper):
         """Main method to scrape all data from SSM website"""
         logger.info(f"Starting scraping process for {self.name}")
         
+        # Parse every page afresh for this run
+        self._soup_tasks = {}
+        
         try:
-            # Get fee information
-            tuition_result = await self.scrape_tuition_fees()
+            # Hold the shared HTTP session open while the scrape_* methods run
+            async with self.session_manager:
+                # The scrape_* methods are independent, so run them concurrently.
+                # Scholarships need no request, so they are not given a task
+                tuition_result, curriculum_result, enrollment_result, contact_result = await asyncio.gather(
+                    self.scrape_tuition_fees(),
+                    self.scrape_curriculum(),
+                    self.scrape_enrollment_process(),
+                    self.scrape_contact_info(),
+                    return_exceptions=True
+                )
+                scholarship_result = await self.scrape_scholarships()
             
-            # Get curriculum data from dedicated method
-            curriculum_result = await self.scrape_curriculum()
+            # Release the parsed pages now that every method has finished
+            self._soup_tasks.clear()
             
-            # Continue with other scraping methods
-            enrollment_result = await self.scrape_enrollment_process()
-            scholarship_result = await self.scrape_scholarships()
-            contact_result = await self.scrape_contact_info()
+            # Convert any raised exceptions into the standard error shape
+            tuition_result, curriculum_result, enrollment_result, scholarship_result, contact_result = [
+                {"status": "error", "message": str(result)} if isinstance(result, Exception) else result
+                for result in (tuition_result, curriculum_result, enrollment_result, scholarship_result, contact_result)
+            ]
             
             results = {
                 "name": self.name,
@@ -961,14 +1131,9 @@ class SSMScraper(BaseScraper):
                 "contact_info": contact_result["data"] if contact_result["status"] == "success" else contact_result
             }
             
-            # Close the Playwright browser when done
-            await close_playwright()
-            
             return results
         except Exception as e:
             logger.error(f"Error in main scrape method: {str(e)}")
-            # Make sure to close Playwright even on errors
-            await close_playwright()
             raise
 
 
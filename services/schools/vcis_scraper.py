@@ -1,6 +1,6 @@
 import sys
 import os
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
 import re
 import json
 import logging
@@ -11,11 +11,163 @@ if __name__ == "__main__":
     sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
 
 from services.scraper import BaseScraper
-from services.session_manager import SessionManager
-from services.playwright_manager import get_with_playwright, close_playwright
+from services.session_manager import get_session_manager
 
 logger = logging.getLogger(__name__)
 
+# Every element the curriculum lookups use sits inside an Elementor widget,
+# section or column, so only those subtrees are built
+_ELEMENTOR_ONLY = SoupStrainer(class_=re.compile(r'elementor'))
+
+# The contact details are all inside icon boxes. The class attribute can
+# still be the raw string while parsing, so match the class as a whole word
+_ICON_BOXES_ONLY = SoupStrainer('div', class_=re.compile(r'(?:^|\s)elementor-icon-box-wrapper(?:\s|$)'))
+
+# Matchers for the Elementor elements looked up on every page, built once
+# instead of on each find/find_all call
+_HEADING_TITLE = SoupStrainer("h2", class_="elementor-heading-title")
+_COLUMN = SoupStrainer("div", class_="elementor-column")
+_TEXT_EDITOR = SoupStrainer("div", class_="elementor-widget-text-editor")
+_SECTION = SoupStrainer("section", class_="elementor-section")
+_ONLINE_PROGRAM = SoupStrainer("div", class_="elementor-element-edc767f")
+_HYBRID_PROGRAM = SoupStrainer("div", class_="elementor-element-58b0756")
+_ICON_BOX = SoupStrainer("div", class_="elementor-icon-box-wrapper")
+_ICON = SoupStrainer("i", class_=["fas", "far"])
+_ICON_DESCRIPTION = SoupStrainer("p", class_="elementor-icon-box-description")
+
+def _find_nested(tag, container, child="p"):
+    """Return the first <child> inside an element matching container, like select_one("<container> <child>")"""
+    for element in tag.find_all(container):
+        found = element.find(child)
+        if found:
+            return found
+    return None
+
+def _programs_from_headings(soup):
+    """Build programs from the Elementor headings and the columns they sit in"""
+    curriculum_data = []
+    
+    # Find program sections - Look for heading elements that contain program names
+    program_headings = soup.find_all(_HEADING_TITLE)
+    
+    for heading in program_headings:
+        # Get program name from the heading
+        program_name = heading.get_text(strip=True)
+        
+        # Skip if it's not a program heading (some headings might be for other sections)
+        if not program_name or len(program_name) < 3:
+            continue
+        
+        # Find the parent column that contains this heading and its description
+        parent_column = heading.find_parent(_COLUMN)
+        if not parent_column:
+            continue
+        
+        # Find the program description in the same column
+        description_element = _find_nested(parent_column, _TEXT_EDITOR)
+        description = ""
+        if description_element:
+            description = description_element.get_text(strip=True)
+        
+        # Create program data structure
+        program_data = {
+            "name": program_name,
+            "description": description
+        }
+        
+        # Add additional information like links if available
+        links = parent_column.find_all("a")
+        if links:
+            program_links = []
+            for link in links:
+                link_url = link.get('href', '')
+                link_text = link.get_text(strip=True)
+                if link_url and link_text:
+                    program_links.append({
+                        "text": link_text,
+                        "url": link_url
+                    })
+            
+            if program_links:
+                program_data["links"] = program_links
+        
+        # Add the program to the curriculum data
+        curriculum_data.append(program_data)
+        logger.info(f"Added program: {program_name}")
+    
+    return curriculum_data
+
+def _programs_from_known_elements(soup):
+    """Fallback for the known VCIS Online and Integrated Hybrid program elements"""
+    curriculum_data = []
+    
+    # Fallback approach - look for specific program sections we know exist
+    # This is based on the HTML structure provided
+    online_program = {
+        "name": "VCIS Online",
+        "description": ""
+    }
+    
+    hybrid_program = {
+        "name": "Integrated Hybrid",
+        "description": ""
+    }
+    
+    # Find descriptions using more specific selectors
+    online_desc = _find_nested(soup, _ONLINE_PROGRAM)
+    if online_desc:
+        online_program["description"] = online_desc.get_text(strip=True)
+    
+    hybrid_desc = _find_nested(soup, _HYBRID_PROGRAM)
+    if hybrid_desc:
+        hybrid_program["description"] = hybrid_desc.get_text(strip=True)
+    
+    if online_program["description"]:
+        curriculum_data.append(online_program)
+        logger.info(f"Added program using fallback method: {online_program['name']}")
+    
+    if hybrid_program["description"]:
+        curriculum_data.append(hybrid_program)
+        logger.info(f"Added program using fallback method: {hybrid_program['name']}")
+    
+    return curriculum_data
+
+def _programs_from_sections(soup):
+    """Most general fallback: a program per Elementor section with a heading and paragraphs"""
+    curriculum_data = []
+    
+    # Look for all sections that might contain program information
+    sections = soup.find_all(_SECTION)
+    
+    for i, section in enumerate(sections):
+        heading = section.find(_HEADING_TITLE)
+        if not heading:
+            continue
+        
+        program_name = heading.get_text(strip=True)
+        
+        # Find paragraphs that might contain descriptions
+        paragraphs = section.find_all("p")
+        description = " ".join([p.get_text(strip=True) for p in paragraphs])
+        
+        if program_name and description:
+            program_data = {
+                "name": program_name,
+                "description": description
+            }
+            
+            curriculum_data.append(program_data)
+            logger.info(f"Added program using general section method: {program_name}")
+    
+    return curriculum_data
+
+# Curriculum strategies, tried in order until one finds programs
+_CURRICULUM_STRATEGIES = (
+    _programs_from_headings,
+    _programs_from_known_elements,
+    _programs_from_sections,
+)
+
 class VCISScraper(BaseScraper):
     """Scraper for Victory Christian International School website"""
     
@@ -24,7 +176,7 @@ class VCISScraper(BaseScraper):
         self.base_url = "https://vcis.edu.ph"
         self.name = "Victory Christian International School"
         self.short_name = "VCIS"
-        self.session_manager = SessionManager()
+        self.session_manager = get_session_manager()
     
     async def scrape_tuition_fees(self):
         """Scrape tuition fee information from VCIS website"""
@@ -46,114 +198,14 @@ class VCISScraper(BaseScraper):
             response = await self.session_manager.get(url)
             
             # Parse the HTML content
-            soup = BeautifulSoup(response.text, 'html.parser')
+            soup = BeautifulSoup(response.content, 'lxml', parse_only=_ELEMENTOR_ONLY)
             
-            # Initialize curriculum data structure
+            # Try each strategy in order until one finds programs
             curriculum_data = []
-            
-            # Find program sections - Look for heading elements that contain program names
-            program_headings = soup.select("h2.elementor-heading-title")
-            
-            for heading in program_headings:
-                # Get program name from the heading
-                program_name = heading.get_text(strip=True)
-                
-                # Skip if it's not a program heading (some headings might be for other sections)
-                if not program_name or len(program_name) < 3:
-                    continue
-                
-                # Find the parent column that contains this heading and its description
-                parent_column = heading.find_parent("div", class_="elementor-column")
-                if not parent_column:
-                    continue
-                
-                # Find the program description in the same column
-                description_element = parent_column.select_one("div.elementor-widget-text-editor p")
-                description = ""
-                if description_element:
-                    description = description_element.get_text(strip=True)
-                
-                # Create program data structure
-                program_data = {
-                    "name": program_name,
-                    "description": description
-                }
-                
-                # Add additional information like links if available
-                links = parent_column.select("a")
-                if links:
-                    program_links = []
-                    for link in links:
-                        link_url = link.get('href', '')
-                        link_text = link.get_text(strip=True)
-                        if link_url and link_text:
-                            program_links.append({
-                                "text": link_text,
-                                "url": link_url
-                            })
-                    
-                    if program_links:
-                        program_data["links"] = program_links
-                
-                # Add the program to the curriculum data
-                curriculum_data.append(program_data)
-                logger.info(f"Added program: {program_name}")
-            
-            # Check if we found any programs
-            if not curriculum_data:
-                # Fallback approach - look for specific program sections we know exist
-                # This is based on the HTML structure provided
-                online_program = {
-                    "name": "VCIS Online",
-                    "description": ""
-                }
-                
-                hybrid_program = {
-                    "name": "Integrated Hybrid",
-                    "description": ""
-                }
-                
-                # Find descriptions using more specific selectors
-                online_desc = soup.select_one("div.elementor-element-edc767f p")
-                if online_desc:
-                    online_program["description"] = online_desc.get_text(strip=True)
-                
-                hybrid_desc = soup.select_one("div.elementor-element-58b0756 p")
-                if hybrid_desc:
-                    hybrid_program["description"] = hybrid_desc.get_text(strip=True)
-                
-                if online_program["description"]:
-                    curriculum_data.append(online_program)
-                    logger.info(f"Added program using fallback method: {online_program['name']}")
-                
-                if hybrid_program["description"]:
-                    curriculum_data.append(hybrid_program)
-                    logger.info(f"Added program using fallback method: {hybrid_program['name']}")
-            
-            # If we still didn't find any programs, try an even more general approach
-            if not curriculum_data:
-                # Look for all sections that might contain program information
-                sections = soup.select("section.elementor-section")
-                
-                for i, section in enumerate(sections):
-                    heading = section.select_one("h2.elementor-heading-title")
-                    if not heading:
-                        continue
-                    
-                    program_name = heading.get_text(strip=True)
-                    
-                    # Find paragraphs that might contain descriptions
-                    paragraphs = section.select("p")
-                    description = " ".join([p.get_text(strip=True) for p in paragraphs])
-                    
-                    if program_name and description:
-                        program_data = {
-                            "name": program_name,
-                            "description": description
-                        }
-                        
-                        curriculum_data.append(program_data)
-                        logger.info(f"Added program using general section method: {program_name}")
+            for strategy in _CURRICULUM_STRATEGIES:
+                curriculum_data = strategy(soup)
+                if curriculum_data:
+                    break
             
             # Return the results
             if curriculum_data:
@@ -216,7 +268,7 @@ class VCISScraper(BaseScraper):
             response = await self.session_manager.get(url)
             
             # Parse the HTML content
-            soup = BeautifulSoup(response.text, 'html.parser')
+            soup = BeautifulSoup(response.content, 'lxml', parse_only=_ICON_BOXES_ONLY)
             
             # Initialize contact data structure with only the requested fields
             contact_data = {
@@ -226,35 +278,45 @@ class VCISScraper(BaseScraper):
             }
             
             # Find icon boxes that contain contact information
-            icon_boxes = soup.select("div.elementor-icon-box-wrapper")
+            icon_boxes = soup.find_all(_ICON_BOX)
             
             for box in icon_boxes:
-                # Get the icon element to determine what type of information this is
-                icon = box.select_one("i.fas, i.far")
-                description = box.select_one("p.elementor-icon-box-description")
+                # Get the icon element to determine what type of information this is;
+                # _ICON only matches icons with a class, so it can be read directly
+                icon = box.find(_ICON)
+                if not icon:
+                    continue
+                
+                icon_class = icon["class"]
+                is_phone = "fa-phone-alt" in icon_class
+                if not is_phone and "fa-envelope" not in icon_class:
+                    continue
                 
-                if not icon or not description:
+                description = box.find(_ICON_DESCRIPTION)
+                if not description:
                     continue
                     
                 # Get the text content
                 info_text = description.get_text(strip=True)
-                icon_class = icon.get("class")
                 
-                # Determine the type of information based on the icon and store only phone and email
-                if icon and icon_class:
-                    if "fa-phone-alt" in icon_class and info_text:
-                        contact_data["phone"] = info_text
-                        logger.info(f"Found phone: {info_text}")
-                    elif "fa-envelope" in icon_class and info_text:
-                        # Handle multiple email addresses separated by pipes
-                        emails = [email.strip() for email in info_text.replace("|", ",").split(",")]
-                        # Filter out empty strings
-                        emails = [email for email in emails if email]
-                        
-                        if emails:
-                            # Use the primary email as the main contact
-                            contact_data["email"] = emails[0]
-                            logger.info(f"Found primary email: {emails[0]}")
+                # Store only phone and email
+                if is_phone and info_text:
+                    contact_data["phone"] = info_text
+                    logger.info(f"Found phone: {info_text}")
+                elif info_text:
+                    # Handle multiple email addresses separated by pipes
+                    emails = [email.strip() for email in info_text.replace("|", ",").split(",")]
+                    # Filter out empty strings
+                    emails = [email for email in emails if email]
+                    
+                    if emails:
+                        # Use the primary email as the main contact
+                        contact_data["email"] = emails[0]
+                        logger.info(f"Found primary email: {emails[0]}")
+                
+                # Stop once both fields are filled
+                if contact_data["phone"] != "N/A" and contact_data["email"] != "N/A":
+                    break
             
             # Check if we found the required contact information
             if contact_data["phone"] != "N/A" or contact_data["email"] != "N/A":
@@ -281,16 +343,23 @@ class VCISScraper(BaseScraper):
         logger.info(f"Starting scraping process for {self.name}")
         
         try:
-            # Get fee information
-            tuition_result = await self.scrape_tuition_fees()
+            # Hold the shared HTTP session open while the scrape_* methods run
+            async with self.session_manager:
+                # The scrape_* methods are independent, so run them concurrently
+                tuition_result, curriculum_result, enrollment_result, scholarship_result, contact_result = await asyncio.gather(
+                    self.scrape_tuition_fees(),
+                    self.scrape_curriculum(),
+                    self.scrape_enrollment_process(),
+                    self.scrape_scholarships(),
+                    self.scrape_contact_info(),
+                    return_exceptions=True
+                )
             
-            # Get curriculum data
-            curriculum_result = await self.scrape_curriculum()
-            
-            # Continue with other scraping methods
-            enrollment_result = await self.scrape_enrollment_process()
-            scholarship_result = await self.scrape_scholarships()
-            contact_result = await self.scrape_contact_info()
+            # Convert any raised exceptions into the standard error shape
+            tuition_result, curriculum_result, enrollment_result, scholarship_result, contact_result = [
+                {"status": "error", "message": str(result)} if isinstance(result, Exception) else result
+                for result in (tuition_result, curriculum_result, enrollment_result, scholarship_result, contact_result)
+            ]
             
             results = {
                 "name": self.name,
@@ -301,14 +370,9 @@ class VCISScraper(BaseScraper):
                 "contact_info": contact_result
             }
             
-            # Close the Playwright browser when done
-            await close_playwright()
-            
             return results
         except Exception as e:
             logger.error(f"Error in main scrape method: {str(e)}")
-            # Make sure to close Playwright even on errors
-            await close_playwright()
             raise
 
 
@@ -1,16 +1,91 @@
 import asyncio
+import functools
 import importlib
+import logging
 import os
-from typing import Dict, List, Any, Optional
+import time
+from typing import Dict, List, Any, Optional, Tuple
 from bs4 import BeautifulSoup
+from curl_cffi.requests.exceptions import ConnectionError as RequestConnectionError, Timeout
 from datetime import datetime
 from services.session_manager import SessionManager
 from services.models import SchoolInfo
 import re
 
+logger = logging.getLogger(__name__)
+
+# URLs that recently came back gone or could not be reached are not requested
+# again until their entry expires: url -> expiry timestamp
+_GONE_URL_TTL = 60 * 60
+_UNREACHABLE_URL_TTL = 5 * 60
+_failed_urls: Dict[str, float] = {}
+
+# Only this much of each page is read; the extracted content is capped at
+# 5000 characters anyway, so the tail of a very large page is never needed
+_MAX_PAGE_BYTES = 2 * 1024 * 1024
+
+# Keyword arguments for soup.find(), matching the common content container
+# selectors without going through the CSS engine
+_MAIN_CONTENT_LOOKUPS = (
+    {'name': 'main'}, {'id': 'main'}, {'class_': 'main'},
+    {'name': 'article'}, {'class_': 'article'}, {'id': 'article'},
+    {'class_': 'content'}, {'id': 'content'}, {'class_': 'page-content'},
+    {'class_': 'entry-content'}, {'class_': 'post-content'},
+    {'class_': 'container'}, {'class_': 'inner-container'},
+)
+
+# Any run of whitespace, newlines included
+_WS_RE = re.compile(r'\s+')
+
+# Keywords the fallback extractors look for, one alternation per field so
+# each tag's text is scanned once instead of once per keyword
+_FEE_KEYWORDS = re.compile(r'fee|tuition|cost|payment|financial', re.IGNORECASE)
+_PROGRAM_KEYWORDS = re.compile(r'program|curriculum|academic|course|study', re.IGNORECASE)
+_ENROLLMENT_KEYWORDS = re.compile(r'enroll|admission|application|apply|requirement', re.IGNORECASE)
+_EVENT_KEYWORDS = re.compile(r'event|calendar|upcoming|schedule', re.IGNORECASE)
+_SCHOLARSHIP_KEYWORDS = re.compile(r'scholarship|financial aid|discount|grant|assistance', re.IGNORECASE)
+_CONTACT_KEYWORDS = re.compile(r'contact|email|phone|address|location', re.IGNORECASE)
+
+# Every tag name any of the fallback extractors looks at
+_KEYWORD_TAGS = ['div', 'section', 'p', 'li', 'address']
+
+def _keyword_candidates(soup: BeautifulSoup) -> List[Tuple[Any, str]]:
+    """
+    Collect (tag, text) for the tags the keyword fallbacks search, in document order
+    
+    The tree is walked and each tag's text read once, however many keyword
+    categories are then checked against the result.
+    """
+    return [(tag, tag.get_text()) for tag in soup.find_all(_KEYWORD_TAGS)]
+
+def _matching_text(candidates: List[Tuple[Any, str]], tag_names: Tuple[str, ...], keywords: re.Pattern) -> str:
+    """Join the stripped text of the candidates with one of tag_names whose text matches keywords"""
+    return "\n".join([tag.get_text(strip=True) for tag, text in candidates
+                      if tag.name in tag_names and keywords.search(text)])
+
+# Sentinel for "not looked up yet" in SchoolScraper._SCRAPER_CACHE
+_MISSING = object()
+
+@functools.lru_cache(maxsize=None)
+def _abbreviate(school_name: str) -> str:
+    """Return the abbreviation used to name a school's scraper module"""
+    school_name_short = school_name.lower().split()[0]
+    if school_name_short == "the":
+        school_name_short = school_name.lower().split()[1]
+    
+    # Convert to abbreviation if possible
+    if len(school_name.split()) > 1:
+        return ''.join([word[0].lower() for word in school_name.split() 
+                        if word.lower() not in ['the', 'and', 'of']])
+    return school_name_short
+
 class BaseScraper:
     """Base class for all school-specific scrapers"""
     
+    # Subclasses that declare their own __slots__ get instances without a
+    # per-instance __dict__; those that don't keep working unchanged
+    __slots__ = ("base_url", "name", "short_name")
+    
     def __init__(self):
         """Initialize the base scraper"""
         self.base_url = ""
@@ -32,6 +107,10 @@ class BaseScraper:
 class SchoolScraper:
     """Universal scraper for school data with a consistent architecture"""
     
+    # School name -> school-specific scraper class, or None for schools
+    # that use the universal scraper
+    _SCRAPER_CACHE: Dict[str, Optional[type]] = {}
+    
     def __init__(self):
         """Initialize the scraper with default headers"""
         self.session_manager = SessionManager(default_headers={
@@ -47,43 +126,37 @@ class SchoolScraper:
             'DNT': '1',
         })
     
+    async def __aenter__(self):
+        await self.session_manager.__aenter__()
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb):
+        # Closes the HTTP session, so its connections are reused for every
+        # school scraped inside the block
+        await self.session_manager.__aexit__(exc_type, exc, tb)
+    
     async def scrape_school(self, school: Dict[str, Any]) -> Dict[str, Any]:
         """
         Scrape comprehensive data for a school using a universal structure
         
         Args:
-            school: School data dictionary from SchoolData utility
+            school: School data dictionary (School.as_dict() from SchoolData utility)
             
         Returns:
             Dictionary with standardized school information
         """
         # Try to use a school-specific scraper if available
         try:
-            school_name_short = school["name"].lower().split()[0]
-            if school_name_short == "the":
-                school_name_short = school["name"].lower().split()[1]
-            
-            # Convert to abbreviation if possible
-            if len(school["name"].split()) > 1:
-                abbreviation = ''.join([word[0].lower() for word in school["name"].split() 
-                                       if word.lower() not in ['the', 'and', 'of']])
-            else:
-                abbreviation = school_name_short
-            
-            # Try to load school-specific scraper
-            module_path = f"services.schools.{abbreviation}_scraper"
-            try:
-                module = importlib.import_module(module_path)
-                # Find the class - it should be the capitalized abbreviation + "Scraper"
-                class_name = abbreviation.upper() + "Scraper"
-                scraper_class = getattr(module, class_name)
-                scraper = scraper_class()
-                return await scraper.scrape(school)
-            except (ImportError, AttributeError):
-                # If specific scraper doesn't exist, continue with universal scraper
-                pass
+            scraper_class = self._find_school_scraper(school["name"])
+            if scraper_class is not None:
+                try:
+                    scraper = scraper_class()
+                    return await scraper.scrape(school)
+                except (ImportError, AttributeError):
+                    # If the specific scraper can't run, continue with universal scraper
+                    pass
         except Exception as e:
-            print(f"Error loading school-specific scraper: {str(e)}")
+            logger.error(f"Error loading school-specific scraper: {str(e)}")
         
         # Create a school info object with the universal structure
         school_info = SchoolInfo(
@@ -91,43 +164,68 @@ class SchoolScraper:
             link=school["link"]
         )
         
+        # Parsed pages for this school, shared by every field that lists the same URL
+        pages: Dict[str, asyncio.Future] = {}
+        
         try:
-            # Parse school fees
-            fee_data = await self._scrape_field(school, "school_fee")
-            school_info.school_fee = fee_data
-            
-            # Parse program/curriculum
-            program_data = await self._scrape_field(school, "program")
-            school_info.program = program_data
-            
-            # Parse enrollment process
-            enrollment_data = await self._scrape_field(school, "Enrollment Process and Requirements")
-            school_info.enrollment_process = enrollment_data
-            
-            # Parse events
-            events_data = await self._scrape_field(school, "Upcoming Events")
-            school_info.events = events_data
-            
-            # Parse discounts and scholarships
-            discount_data = await self._scrape_field(school, "Discounts and Scholarship")
-            school_info.discounts_scholarships = discount_data
-            
-            # Parse contact information
-            contact_data = await self._scrape_field(school, "Contact Information ")
-            school_info.contact_info = contact_data
+            # The fields are fetched from independent URLs, so scrape them concurrently
+            (
+                school_info.school_fee,
+                school_info.program,
+                school_info.enrollment_process,
+                school_info.events,
+                school_info.discounts_scholarships,
+                school_info.contact_info,
+            ) = await asyncio.gather(
+                self._scrape_field(school, "school_fee", pages),
+                self._scrape_field(school, "program", pages),
+                self._scrape_field(school, "Enrollment Process and Requirements", pages),
+                self._scrape_field(school, "Upcoming Events", pages),
+                self._scrape_field(school, "Discounts and Scholarship", pages),
+                self._scrape_field(school, "Contact Information", pages),
+            )
             
         except Exception as e:
             school_info.notes = f"Error during scraping: {str(e)} at {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"
         
         return school_info.to_dict()
     
-    async def _scrape_field(self, school: Dict[str, Any], field_name: str) -> str:
+    def _find_school_scraper(self, school_name: str) -> Optional[type]:
+        """
+        Return the school-specific scraper class for a school, or None if it has none
+        
+        The lookup result is remembered per school name in _SCRAPER_CACHE, so
+        the import machinery (and the ImportError for schools without a
+        scraper) only runs once per school.
+        """
+        scraper_class = self._SCRAPER_CACHE.get(school_name, _MISSING)
+        if scraper_class is _MISSING:
+            abbreviation = _abbreviate(school_name)
+            
+            # Try to load school-specific scraper
+            module_path = f"services.schools.{abbreviation}_scraper"
+            try:
+                module = importlib.import_module(module_path)
+                # Find the class - it should be the capitalized abbreviation + "Scraper"
+                class_name = abbreviation.upper() + "Scraper"
+                scraper_class = getattr(module, class_name)
+            except (ImportError, AttributeError):
+                # If specific scraper doesn't exist, continue with universal scraper
+                scraper_class = None
+            self._SCRAPER_CACHE[school_name] = scraper_class
+        return scraper_class
+    
+    async def _scrape_field(self, school: Dict[str, Any], field_name: str,
+                            pages: Optional[Dict[str, asyncio.Future]] = None) -> str:
         """
         Scrape specific field data from URLs
         
         Args:
             school: School data dictionary
             field_name: Name of the field to scrape
+            pages: Optional url -> pending parsed page map shared between the
+                fields of one school, so a URL listed under several fields is
+                fetched and parsed once
             
         Returns:
             Formatted string with scraped information
@@ -142,27 +240,13 @@ class SchoolScraper:
         if isinstance(field_data, str):
             field_data = [field_data]
         
-        # Scrape data from each URL
-        results = []
-        for url in field_data:
-            try:
-                # Skip empty URLs
-                if not url:
-                    continue
-                    
-                # Get HTML content
-                response = await self.session_manager.get(url)
-                html = response.text
-                
-                # Parse HTML
-                soup = BeautifulSoup(html, 'html.parser')
-                
-                # Extract main content
-                content = self._extract_content(soup, field_name)
-                if content:
-                    results.append(f"From {url}:\n{content}")
-            except Exception as e:
-                results.append(f"Error scraping {url}: {str(e)}")
+        if pages is None:
+            pages = {}
+        
+        # Scrape data from each URL concurrently (skipping empty URLs); the
+        # session manager already limits how many requests hit one host
+        results = await asyncio.gather(*(self._scrape_url(url, field_name, pages) for url in field_data if url))
+        results = [result for result in results if result]
         
         # Join results with separators
         if not results:
@@ -170,82 +254,143 @@ class SchoolScraper:
         
         return "\n\n---\n\n".join(results)
     
-    def _extract_content(self, soup: BeautifulSoup, field_name: str) -> str:
+    async def _scrape_url(self, url: str, field_name: str, pages: Dict[str, asyncio.Future]) -> Optional[str]:
+        """Scrape one URL of a field, returning its formatted section or None if it had no content"""
+        try:
+            content = await self._get_content(url, field_name, pages)
+            if content:
+                return f"From {url}:\n{content}"
+        except Exception as e:
+            return f"Error scraping {url}: {str(e)}"
+        return None
+    
+    async def _get_page(self, url: str) -> Any:
+        """
+        Fetch a page through the session manager, which revalidates pages it has
+        seen before with a conditional GET
+        
+        Raises an error without making a request if the URL is in _failed_urls.
+        A 404/410 response keeps the URL there for _GONE_URL_TTL seconds and a
+        timeout or connection error for _UNREACHABLE_URL_TTL seconds.
+        """
+        if _failed_urls.get(url, 0) > time.monotonic():
+            raise RuntimeError("skipped, the URL failed recently")
+        
+        try:
+            response = await self.session_manager.get(url, max_bytes=_MAX_PAGE_BYTES)
+        except (Timeout, RequestConnectionError):
+            _failed_urls[url] = time.monotonic() + _UNREACHABLE_URL_TTL
+            raise
+        
+        if response.status_code in (404, 410):
+            _failed_urls[url] = time.monotonic() + _GONE_URL_TTL
+        return response
+    
+    async def _get_content(self, url: str, field_name: str, pages: Dict[str, asyncio.Future]) -> str:
+        """Extract the content of url for field_name from the page shared through pages"""
+        # The pending task is shared rather than the result, so fields that
+        # ask for the same URL at the same time wait on one fetch and parse
+        task = pages.get(url)
+        if task is None:
+            task = pages[url] = asyncio.ensure_future(self._load_page(url))
+        _, page = await task
+        
+        # Extract in a worker thread so other fields' requests keep going
+        # while this page is processed
+        return await asyncio.to_thread(self._extract_content, page, field_name)
+    
+    async def _load_page(self, url: str) -> Tuple[Any, Tuple]:
+        """Fetch url and parse it in a worker thread, returning (response, page)"""
+        # Get HTML content
+        response = await self._get_page(url)
+        
+        page = await asyncio.to_thread(self._parse_page, response.content)
+        return response, page
+    
+    def _parse_page(self, html: bytes) -> Tuple[BeautifulSoup, Optional[Any], Optional[List[Tuple[Any, str]]]]:
+        """
+        Parse an HTML page into the (soup, main_content, candidates) every field extracts from
+        
+        Script and style elements are removed and the main content container
+        is located here, once per page. The keyword fallback candidates are
+        only collected when there is no main content container.
+        """
+        soup = BeautifulSoup(html, 'lxml')
+        
+        # Remove script and style elements
+        for script in soup(["script", "style", "iframe", "noscript"]):
+            script.extract()
+        
+        # Try to find main content container
+        main_content = self._find_main_content(soup)
+        candidates = _keyword_candidates(soup) if not main_content else None
+        return soup, main_content, candidates
+    
+    def _extract_content(self, page: Tuple[BeautifulSoup, Optional[Any], Optional[List[Tuple[Any, str]]]],
+                         field_name: str) -> str:
         """
         Extract relevant content based on field name
         
         Args:
-            soup: BeautifulSoup object
+            page: (soup, main_content, candidates) from _parse_page
             field_name: Name of the field being scraped
             
         Returns:
             Formatted string with extracted content
         """
-        # Remove script and style elements
-        for script in soup(["script", "style", "iframe", "noscript"]):
-            script.extract()
-        
+        soup, main_content, candidates = page
         content = ""
         
-        # Try to find main content container
-        main_content = self._find_main_content(soup)
-        
         if not main_content:
             # Fallback to extracting relevant sections
             if field_name == "school_fee":
-                content = self._extract_fees(soup)
+                content = self._extract_fees(soup, candidates)
             elif field_name == "program":
-                content = self._extract_program(soup)
+                content = self._extract_program(candidates)
             elif "Enrollment" in field_name:
-                content = self._extract_enrollment(soup)
+                content = self._extract_enrollment(candidates)
             elif "Events" in field_name:
-                content = self._extract_events(soup)
+                content = self._extract_events(candidates)
             elif "Discounts" in field_name:
-                content = self._extract_scholarships(soup)
+                content = self._extract_scholarships(candidates)
             elif "Contact" in field_name:
-                content = self._extract_contact(soup)
+                content = self._extract_contact(candidates)
             else:
                 # Generic content extraction
                 paragraphs = soup.find_all('p')
-                content = "\n".join([p.get_text(strip=True) for p in paragraphs if p.get_text(strip=True)])
+                content = "\n".join(filter(None, (p.get_text(strip=True) for p in paragraphs)))
         else:
             # Extract text from main content
             paragraphs = main_content.find_all(['p', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6', 'li'])
-            content = "\n".join([p.get_text(strip=True) for p in paragraphs if p.get_text(strip=True)])
+            content = "\n".join(filter(None, (p.get_text(strip=True) for p in paragraphs)))
         
         # Clean up content
-        content = re.sub(r'\s+', ' ', content).strip()
-        content = re.sub(r'\n+', '\n', content).strip()
+        content = _WS_RE.sub(' ', content).strip()
         
         return content[:5000] if content else "No structured data found"
     
     def _find_main_content(self, soup: BeautifulSoup) -> Optional[Any]:
         """Find the main content container in a webpage"""
-        # Try common content container selectors
-        selectors = [
-            'main', '#main', '.main', 
-            'article', '.article', '#article',
-            '.content', '#content', '.page-content', 
-            '.entry-content', '.post-content',
-            '.container', '.inner-container'
-        ]
-        
-        for selector in selectors:
-            content = soup.select_one(selector)
+        # Try common content containers, in the same order as the CSS selectors
+        # 'main', '#main', '.main', 'article', '.article', '#article', '.content',
+        # '#content', '.page-content', '.entry-content', '.post-content',
+        # '.container', '.inner-container'
+        for lookup in _MAIN_CONTENT_LOOKUPS:
+            content = soup.find(**lookup)
             if content and len(content.get_text(strip=True)) > 100:
                 return content
                 
-        # Try to find largest text container
-        containers = soup.find_all(['div', 'section'], class_=True)
-        if containers:
-            # Sort by amount of text content
-            containers = sorted(containers, key=lambda x: len(x.get_text(strip=True)), reverse=True)
-            if containers and len(containers[0].get_text(strip=True)) > 100:
-                return containers[0]
-        
-        return None
+        # Try to find largest text container (the first one, on ties) with
+        # a single pass instead of sorting all of them
+        best, best_length = None, 100
+        for container in soup.find_all(['div', 'section'], class_=True):
+            length = len(container.get_text(strip=True))
+            if length > best_length:
+                best, best_length = container, length
+        
+        return best
     
-    def _extract_fees(self, soup: BeautifulSoup) -> str:
+    def _extract_fees(self, soup: BeautifulSoup, candidates: List[Tuple[Any, str]]) -> str:
         """Extract school fee information"""
         # Look for tables that might contain fee information
         tables = soup.find_all('table')
@@ -253,77 +398,24 @@ class SchoolScraper:
             return "\n".join([table.get_text(strip=True, separator="\n") for table in tables])
         
         # Look for fee-related content
-        fee_related = soup.find_all(
-            lambda tag: tag.name in ['div', 'section', 'p'] and 
-            any(keyword in tag.get_text().lower() for keyword in ['fee', 'tuition', 'cost', 'payment', 'financial'])
-        )
-        
-        if fee_related:
-            return "\n".join([elem.get_text(strip=True) for elem in fee_related])
-        
-        return ""
+        return _matching_text(candidates, ('div', 'section', 'p'), _FEE_KEYWORDS)
     
-    def _extract_program(self, soup: BeautifulSoup) -> str:
+    def _extract_program(self, candidates: List[Tuple[Any, str]]) -> str:
         """Extract program/curriculum information"""
-        # Look for curriculum-related content
-        program_related = soup.find_all(
-            lambda tag: tag.name in ['div', 'section', 'p', 'li'] and 
-            any(keyword in tag.get_text().lower() for keyword in ['program', 'curriculum', 'academic', 'course', 'study'])
-        )
-        
-        if program_related:
-            return "\n".join([elem.get_text(strip=True) for elem in program_related])
-        
-        return ""
+        return _matching_text(candidates, ('div', 'section', 'p', 'li'), _PROGRAM_KEYWORDS)
     
-    def _extract_enrollment(self, soup: BeautifulSoup) -> str:
+    def _extract_enrollment(self, candidates: List[Tuple[Any, str]]) -> str:
         """Extract enrollment process information"""
-        # Look for enrollment-related content
-        enrollment_related = soup.find_all(
-            lambda tag: tag.name in ['div', 'section', 'p', 'li'] and 
-            any(keyword in tag.get_text().lower() for keyword in ['enroll', 'admission', 'application', 'apply', 'requirement'])
-        )
-        
-        if enrollment_related:
-            return "\n".join([elem.get_text(strip=True) for elem in enrollment_related])
-        
-        return ""
+        return _matching_text(candidates, ('div', 'section', 'p', 'li'), _ENROLLMENT_KEYWORDS)
     
-    def _extract_events(self, soup: BeautifulSoup) -> str:
+    def _extract_events(self, candidates: List[Tuple[Any, str]]) -> str:
         """Extract upcoming events information"""
-        # Look for event-related content
-        event_related = soup.find_all(
-            lambda tag: tag.name in ['div', 'section', 'p', 'li'] and 
-            any(keyword in tag.get_text().lower() for keyword in ['event', 'calendar', 'upcoming', 'schedule'])
-        )
-        
-        if event_related:
-            return "\n".join([elem.get_text(strip=True) for elem in event_related])
-        
-        return ""
+        return _matching_text(candidates, ('div', 'section', 'p', 'li'), _EVENT_KEYWORDS)
     
-    def _extract_scholarships(self, soup: BeautifulSoup) -> str:
+    def _extract_scholarships(self, candidates: List[Tuple[Any, str]]) -> str:
         """Extract scholarship information"""
-        # Look for scholarship-related content
-        scholarship_related = soup.find_all(
-            lambda tag: tag.name in ['div', 'section', 'p', 'li'] and 
-            any(keyword in tag.get_text().lower() for keyword in ['scholarship', 'financial aid', 'discount', 'grant', 'assistance'])
-        )
-        
-        if scholarship_related:
-            return "\n".join([elem.get_text(strip=True) for elem in scholarship_related])
-        
-        return ""
+        return _matching_text(candidates, ('div', 'section', 'p', 'li'), _SCHOLARSHIP_KEYWORDS)
     
-    def _extract_contact(self, soup: BeautifulSoup) -> str:
+    def _extract_contact(self, candidates: List[Tuple[Any, str]]) -> str:
         """Extract contact information"""
-        # Look for contact-related content
-        contact_related = soup.find_all(
-            lambda tag: tag.name in ['div', 'section', 'p', 'li', 'address'] and 
-            any(keyword in tag.get_text().lower() for keyword in ['contact', 'email', 'phone', 'address', 'location'])
-        )
-        
-        if contact_related:
-            return "\n".join([elem.get_text(strip=True) for elem in contact_related])
-        
-        return ""
\ No newline at end of file
+        return _matching_text(candidates, ('div', 'section', 'p', 'li', 'address'), _CONTACT_KEYWORDS)
\ No newline at end of file
@@ -1,10 +1,35 @@
 import asyncio
-from typing import Dict, List, Any, Optional, Union
+import inspect
+from collections import OrderedDict, defaultdict
+from urllib.parse import urlsplit
+from typing import Dict, List, Any, Optional, Tuple, Union
 from curl_cffi import AsyncSession
 
+# Validators and bodies from previous GET responses, shared by all session
+# managers and evicted least recently used first:
+# url -> (etag, last_modified, content, encoding)
+_conditional_cache: "OrderedDict[str, Tuple[Optional[str], Optional[str], bytes, str]]" = OrderedDict()
+
+# Maximum number of responses remembered for conditional GETs
+MAX_CACHED_RESPONSES = 128
+
+# Maximum number of in-flight GET requests to any one host
+MAX_REQUESTS_PER_HOST = 5
+
 class SessionManager:
     """
     Session manager for making asynchronous HTTP requests using curl_cffi.
+    
+    A single AsyncSession is created lazily and reused for every request so
+    that keep-alive connections (and their TCP/TLS handshakes) are shared
+    across calls. The default headers are set once on that session rather
+    than merged into every request. GET requests are limited to
+    MAX_REQUESTS_PER_HOST in flight per host. Call close() (or use the
+    manager as an async context manager) when done.
+    
+    The async context manager can be entered by several users at once (for
+    example scrapers sharing get_session_manager()); the session is only
+    closed when the last of them exits.
     """
     
     def __init__(self, default_headers: Optional[Dict[str, str]] = None):
@@ -15,6 +40,35 @@ class SessionManager:
             default_headers: Default headers to use for all requests.
         """
         self.default_headers = default_headers or {}
+        self._session: Optional[AsyncSession] = None
+        self._host_slots: Dict[str, asyncio.Semaphore] = {}
+        self._users = 0
+    
+    async def __aenter__(self):
+        self._users += 1
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb):
+        self._users -= 1
+        if self._users == 0:
+            await self.close()
+    
+    def _get_session(self) -> AsyncSession:
+        """Return the shared session, creating it on first use."""
+        if self._session is None:
+            self._session = AsyncSession(impersonate="chrome131", headers=self.default_headers)
+            # Semaphores are tied to the event loop, like the session itself
+            self._host_slots = defaultdict(lambda: asyncio.Semaphore(MAX_REQUESTS_PER_HOST))
+        return self._session
+    
+    async def close(self):
+        """Close the shared session and release its pooled connections."""
+        if self._session is not None:
+            session, self._session = self._session, None
+            # AsyncSession.close() is a plain method in older curl_cffi releases
+            closing = session.close()
+            if inspect.isawaitable(closing):
+                await closing
         
     async def make_requests(self, 
                            requests: List[Dict[str, Any]]) -> List[Any]:
@@ -32,50 +86,106 @@ class SessionManager:
         Returns:
             List of response objects
         """
-        async with AsyncSession(impersonate="chrome131") as session:
-            tasks = []
-            for req in requests:
-                url = req['url']
-                method = req.get('method', 'GET').lower()
-                
-                # Combine default headers with request-specific headers
-                headers = {**self.default_headers}
-                if 'headers' in req:
-                    headers.update(req['headers'])
-                
-                # Build request kwargs
-                kwargs = {'headers': headers}
-                
-                if 'data' in req:
-                    kwargs['data'] = req['data']
-                    
-                if 'json' in req:
-                    kwargs['json'] = req['json']
-                
-                # Create appropriate request task based on method
-                http_method = getattr(session, method)
-                task = http_method(url, **kwargs)
-                tasks.append(task)
+        session = self._get_session()
+        tasks = []
+        for req in requests:
+            url = req['url']
+            method = req.get('method', 'GET').lower()
+            
+            # The session supplies the default headers; add request-specific ones
+            kwargs = {'headers': req.get('headers')}
+            
+            if 'data' in req:
+                kwargs['data'] = req['data']
                 
-            return await asyncio.gather(*tasks, return_exceptions=True)
+            if 'json' in req:
+                kwargs['json'] = req['json']
+            
+            # Create appropriate request task based on method
+            http_method = getattr(session, method)
+            task = http_method(url, **kwargs)
+            tasks.append(task)
+            
+        return await asyncio.gather(*tasks, return_exceptions=True)
     
-    async def get(self, url: str, headers: Optional[Dict[str, str]] = None) -> Any:
+    async def get(self, url: str, headers: Optional[Dict[str, str]] = None,
+                  max_bytes: Optional[int] = None) -> Any:
         """
         Make a GET request.
         
+        Responses that carry an ETag or Last-Modified header are remembered,
+        and later requests for the same URL are sent as conditional GETs. On
+        a 304 Not Modified the remembered body is filled into the response,
+        which is returned with status 200 and the remembered validators, so
+        callers can recognise unchanged pages by their ETag/Last-Modified.
+        At most MAX_CACHED_RESPONSES URLs are remembered.
+        
         Args:
             url: The URL to request
             headers: Optional headers
+            max_bytes: If given, the body is streamed and only its first
+                max_bytes bytes are kept in the response's content
             
         Returns:
             Response object
         """
-        async with AsyncSession(impersonate="chrome131", timeout=(3.05, 27)) as session:
-            combined_headers = {**self.default_headers}
-            
-            if headers:
-                combined_headers.update(headers)
-            return await session.get(url, headers=combined_headers)
+        session = self._get_session()
+        combined_headers = {}
+        
+        cached = _conditional_cache.get(url)
+        if cached:
+            _conditional_cache.move_to_end(url)
+            etag, last_modified, _, _ = cached
+            if etag:
+                combined_headers['If-None-Match'] = etag
+            if last_modified:
+                combined_headers['If-Modified-Since'] = last_modified
+        
+        if headers:
+            combined_headers.update(headers)
+        async with self._host_slots[urlsplit(url).netloc]:
+            if max_bytes is None:
+                response = await session.get(url, headers=combined_headers, timeout=(3.05, 27))
+            else:
+                response = await self._get_capped(session, url, combined_headers, max_bytes)
+        
+        if response.status_code == 304 and cached:
+            etag, last_modified, content, encoding = cached
+            response.status_code = 200
+            response.reason = 'OK'
+            response.content = content
+            response.encoding = encoding
+            if etag:
+                response.headers['ETag'] = etag
+            if last_modified:
+                response.headers['Last-Modified'] = last_modified
+            return response
+        
+        # A body cut short by max_bytes is not remembered, so that a 304 never
+        # hands a truncated page to a caller that asked for all of it
+        truncated = max_bytes is not None and len(response.content) >= max_bytes
+        if response.status_code == 200 and not truncated:
+            etag = response.headers.get('ETag')
+            last_modified = response.headers.get('Last-Modified')
+            if etag or last_modified:
+                _conditional_cache[url] = (etag, last_modified, response.content, response.encoding)
+                _conditional_cache.move_to_end(url)
+                if len(_conditional_cache) > MAX_CACHED_RESPONSES:
+                    _conditional_cache.popitem(last=False)
+        
+        return response
+    
+    async def _get_capped(self, session: AsyncSession, url: str,
+                          headers: Dict[str, str], max_bytes: int) -> Any:
+        """Stream a GET response, stopping once max_bytes of the body have been read."""
+        body = bytearray()
+        async with session.stream("GET", url, headers=headers, timeout=(3.05, 27)) as response:
+            async for chunk in response.aiter_content():
+                body += chunk
+                if len(body) >= max_bytes:
+                    break
+        response.content = bytes(body[:max_bytes])
+        return response
     
     async def post(self, url: str, 
                   data: Optional[Union[str, Dict]] = None,
@@ -93,15 +203,27 @@ class SessionManager:
         Returns:
             Response object
         """
-        async with AsyncSession(impersonate="chrome131") as session:
-            combined_headers = {**self.default_headers}
-            if headers:
-                combined_headers.update(headers)
+        session = self._get_session()
+        kwargs = {'headers': headers}
+        if data is not None:
+            kwargs['data'] = data
+        if json is not None:
+            kwargs['json'] = json
             
-            kwargs = {'headers': combined_headers}
-            if data is not None:
-                kwargs['data'] = data
-            if json is not None:
-                kwargs['json'] = json
-                
-            return await session.post(url, **kwargs)
\ No newline at end of file
+        return await session.post(url, **kwargs)
+
+# Process-wide manager shared by scrapers so their requests reuse one pool
+_shared_session_manager: Optional[SessionManager] = None
+
+def get_session_manager() -> SessionManager:
+    """
+    Return the session manager shared across scrapers, creating it on first use.
+    
+    Users should enter it with ``async with`` for the duration of their
+    requests rather than calling close() directly, so that one scraper
+    finishing does not close the session under another.
+    """
+    global _shared_session_manager
+    if _shared_session_manager is None:
+        _shared_session_manager = SessionManager()
+    return _shared_session_manager
\ No newline at end of file